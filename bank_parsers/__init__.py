@@ -84,6 +84,10 @@ class BankParserRegistry:
                 return parser
         return None
     
+    def parsers(self) -> List[BankStatementParser]:
+        """Get the registered parsers in the order get_parser tries them."""
+        return list(self._parsers)
+    
     def list_supported_banks(self) -> List[str]:
         """Get list of supported bank names."""
         return [parser.bank_name for parser in self._parsers]
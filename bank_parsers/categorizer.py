@@ -139,24 +139,64 @@ def match_category(candidate: Optional[str], categories: Dict[str, List[str]]) -
 # ---------------------------------------------------------------------------
 # Keyword matching (normalized)
 # ---------------------------------------------------------------------------
-def _keyword_match(description: str, categories: Dict[str, List[str]]) -> Optional[str]:
-    """Keyword/substring match on the CLEANED description.
+try:
+    import ahocorasick
+
+    _HAVE_AC = True
+except Exception:  # pragma: no cover - optional
+    _HAVE_AC = False
+
+
+class _KeywordMatcher:
+    """Keyword/substring matcher over the CLEANED description.
 
     Most-specific categories first (most keywords), longest keywords first.
+    The priority order and lowercased keywords are computed once per category
+    set. With pyahocorasick installed, all keywords go into one automaton so a
+    description is scanned once and the highest-priority hit wins; otherwise
+    the ordered substring loop is used.
     """
-    if not description:
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        sorted_categories = sorted(
+            categories.items(), key=lambda kv: len(kv[1]), reverse=True
+        )
+        self._ordered: List[Tuple[str, List[str]]] = [
+            (category, [kw.lower() for kw in sorted(keywords, key=len, reverse=True) if kw])
+            for category, keywords in sorted_categories
+        ]
+        self._automaton = None
+        if _HAVE_AC and any(kws for _, kws in self._ordered):
+            # keyword -> best (lowest) category rank that lists it
+            best_rank: Dict[str, int] = {}
+            for rank, (_category, keywords) in enumerate(self._ordered):
+                for kw in keywords:
+                    best_rank.setdefault(kw, rank)
+            automaton = ahocorasick.Automaton()
+            for kw, rank in best_rank.items():
+                automaton.add_word(kw, rank)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the best category for already-cleaned (lowercased) text."""
+        if not text:
+            return None
+        if self._automaton is not None:
+            best = min((rank for _end, rank in self._automaton.iter(text)), default=None)
+            return None if best is None else self._ordered[best][0]
+        for category, keywords in self._ordered:
+            for kw in keywords:
+                if kw in text:
+                    return category
         return None
-    text = clean_for_categorization(description)
-    if not text:
+
+
+def _keyword_match(description: str, categories: Dict[str, List[str]]) -> Optional[str]:
+    """Keyword/substring match on the CLEANED description (one-off helper)."""
+    if not description:
         return None
-    sorted_categories = sorted(
-        categories.items(), key=lambda kv: len(kv[1]), reverse=True
-    )
-    for category, keywords in sorted_categories:
-        for kw in sorted(keywords, key=len, reverse=True):
-            if kw and kw.lower() in text:
-                return category
-    return None
+    return _KeywordMatcher(categories).match(clean_for_categorization(description))
 
 
 # ---------------------------------------------------------------------------
@@ -191,6 +231,8 @@ class Categorizer:
         if DEFAULT_CATEGORY not in self.categories:
             self.categories[DEFAULT_CATEGORY] = []
         self.learned = learned if learned is not None else load_learned()
+        self._learned_lower = self._lower_learned(self.learned)
+        self._keyword_matcher = _KeywordMatcher(self.categories)
         self.merchant_normalizer = get_merchant_normalizer()
         self.status_callback = status_callback or (lambda _msg: None)
 
@@ -247,6 +289,11 @@ class Categorizer:
         return stats
 
     # -- deterministic ------------------------------------------------------
+    @staticmethod
+    def _lower_learned(learned: Dict[str, str]) -> List[Tuple[str, str]]:
+        """(lowercased merchant, category) pairs, skipping empty merchants."""
+        return [(m.lower(), c) for m, c in learned.items() if m]
+
     def _matched_learned(self, txn: Dict[str, Any]) -> bool:
         """True if the transaction's category came from learned_categories."""
         cat = txn.get("category")
@@ -261,14 +308,14 @@ class Categorizer:
         text = clean_for_categorization(description)
 
         # 1. Learned categories (merchant substring match on normalized text).
-        for merchant, category in self.learned.items():
-            if merchant and merchant.lower() in text:
+        for merchant, category in self._learned_lower:
+            if merchant in text:
                 # Validate the learned category still exists.
                 if category in self.categories:
                     return category
 
         # 2. Keyword matching on cleaned text.
-        kw = _keyword_match(description, self.categories)
+        kw = self._keyword_matcher.match(text)
         if kw is not None:
             return kw
 
@@ -388,6 +435,7 @@ class Categorizer:
         if not key:
             return
         self.learned[key] = category
+        self._learned_lower = self._lower_learned(self.learned)
         save_learned(self.learned)
 
 
@@ -30,6 +30,18 @@ except ImportError:
 
 from . import BankStatementParser
 
+# Money and date patterns shared by the labeler and the parser, compiled once at import
+RE_MONEY = re.compile(r"[+\-]?\$?\d{1,3}(?:,\d{3})*\.\d{2}")
+RE_DATE = re.compile(
+    r"""(?ix)
+    (?:\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?)     # 01/31[/2025]
+    | (?:\d{4}[/-]\d{1,2}[/-]\d{1,2})          # 2025-01-31
+    | (?:\d{1,2}\s+[A-Za-z]{3,9}\s+\d{2,4})    # 31 Jan 2025
+    | (?:[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{2,4})  # Jan 31, 2025
+    | (?:[A-Za-z]{3,9}\s+\d{1,2})              # Jan 31
+    """
+)
+
 
 @dataclass
 class Token:
@@ -50,6 +62,9 @@ class Line:
 class WeakSupervisionLabeler:
     """Weak supervision labeling functions for transaction classification."""
     
+    RE_MONEY = RE_MONEY
+    RE_DATE = RE_DATE
+    
     def __init__(self):
         self.openai_enabled = self._check_openai_enabled()
         self.openai_client = None
@@ -58,18 +73,6 @@ class WeakSupervisionLabeler:
         if self.openai_enabled:
             self.openai_client = self._init_openai_client()
         
-        # Regex patterns for labeling functions
-        self.RE_MONEY = re.compile(r"[+\-]?\$?\d{1,3}(?:,\d{3})*\.\d{2}")
-        self.RE_DATE = re.compile(
-            r"""(?ix)
-            (?:\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?)     # 01/31[/2025]
-            | (?:\d{4}[/-]\d{1,2}[/-]\d{1,2})          # 2025-01-31
-            | (?:\d{1,2}\s+[A-Za-z]{3,9}\s+\d{2,4})    # 31 Jan 2025
-            | (?:[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{2,4})  # Jan 31, 2025
-            | (?:[A-Za-z]{3,9}\s+\d{1,2})              # Jan 31
-            """
-        )
-        
         # Define labeling functions
         self.labeling_functions = [
             self.lf_has_date_and_amount,
@@ -656,6 +659,9 @@ class RegexPatternCollector:
 class GenericRegexParser(BankStatementParser):
     """Generic parser using K-means clustering and weak supervision for transaction detection."""
     
+    RE_MONEY = RE_MONEY
+    RE_DATE = RE_DATE
+    
     def __init__(self):
         super().__init__()
         self.bank_name = "Generic (Auto-detect)"
@@ -675,9 +681,6 @@ class GenericRegexParser(BankStatementParser):
         self._cached_money_pattern = None
         self._cached_date_pattern = None
         
-        # Initialize regex patterns lazily for better startup performance
-        self._init_regex_patterns()
-        
         # Keywords that indicate non-transaction lines
         self.summary_keywords = [
             'previous balance', 'new balance', 'minimum payment', 'payment due',
@@ -687,19 +690,6 @@ class GenericRegexParser(BankStatementParser):
             'www.', '.com', 'http', 'total', 'subtotal'
         ]
     
-    def _init_regex_patterns(self):
-        """Initialize regex patterns lazily."""
-        self.RE_MONEY = re.compile(r"[+\-]?\$?\d{1,3}(?:,\d{3})*\.\d{2}")
-        self.RE_DATE = re.compile(
-            r"""(?ix)
-            (?:\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?)     # 01/31[/2025]
-            | (?:\d{4}[/-]\d{1,2}[/-]\d{1,2})          # 2025-01-31
-            | (?:\d{1,2}\s+[A-Za-z]{3,9}\s+\d{2,4})    # 31 Jan 2025
-            | (?:[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{2,4})  # Jan 31, 2025
-            | (?:[A-Za-z]{3,9}\s+\d{1,2})              # Jan 31
-            """
-        )
-    
     # Lazy loading properties
     @property
     def weak_labeler(self):
@@ -210,7 +210,7 @@ class TransactionValidator:
         
         # Date tolerance: within 7 days
         if txn.date:
-            date_key = txn.date.strftime("%Y-%m")
+            date_key = f"{txn.date.year:04d}-{txn.date.month:02d}"
         else:
             date_key = "unknown"
         
@@ -482,7 +482,7 @@ def find_duplicates(transactions: List[Transaction]) -> List[Tuple[Transaction,
         # Create fingerprint
         desc_normalized = re.sub(r'[^\w]', '', txn.description.lower())
         amount_key = f"{abs(txn.amount):.2f}" if txn.amount else "0.00"
-        date_key = txn.date.strftime("%Y-%m") if txn.date else "unknown"
+        date_key = f"{txn.date.year:04d}-{txn.date.month:02d}" if txn.date else "unknown"
         fingerprint = f"{desc_normalized}_{amount_key}_{date_key}"
         
         if fingerprint in seen:
@@ -11,9 +11,11 @@ This module is the user-facing API. The heavy lifting lives in bank_parsers/.
 """
 
 import argparse
+import itertools
 import json
 import os
 import re
+from collections import Counter
 from datetime import date, datetime
 
 import pandas as pd
@@ -58,6 +60,8 @@ class BankStatementAnalyzer:
             categories = self._load_categories_from_config()
         self.categories = categories
         self.transactions = []
+        self._desc_lower_source = None  # transactions list _desc_lower was built from
+        self._desc_lower = []
         self.learned_categories = {}
         self.learned_categories_file = os.path.join(
             os.path.dirname(os.path.abspath(__file__)),
@@ -147,17 +151,31 @@ class BankStatementAnalyzer:
             return []
         bank = detect_bank(text, pdf_path)
         parser = get_parser_for_bank(bank)
+        # A fresh list per call: with no parser, returning self.transactions
+        # would hand back the previous statement's transactions again
+        transactions = []
         if parser:
             raw = parser.extract_transactions(text)
-            self.transactions = clean_transactions(raw)
-        return self.transactions
+            transactions = clean_transactions(raw)
+        self.transactions = transactions
+        return transactions
 
     def extract_from_multiple_pdfs(self, pdf_paths, use_multiprocessing=True):
-        """Extract transactions from multiple PDF bank statements."""
-        original_transactions = self.transactions.copy()
-        self.transactions = []
-        for pdf_path in pdf_paths:
-            self.extract_from_pdf(pdf_path)
+        """Extract transactions from multiple PDF bank statements.
+
+        With use_multiprocessing, each PDF is parsed in its own worker process
+        (see extract_one) and the results are merged here. Workers use their
+        own analyzers, so the pipeline's status messages are not relayed;
+        status_callback gets one message per file finished in a worker instead.
+        """
+        merged = []
+        for pdf_path, txns, in_worker in self._iter_extracted(pdf_paths, use_multiprocessing):
+            merged.extend(txns)
+            if in_worker and self.status_callback:
+                self.status_callback(
+                    f"📄 Extracted {len(txns)} transactions from {os.path.basename(pdf_path)}"
+                )
+        self.transactions = merged
         # Sort all transactions by date where possible. Dates from the pipeline
         # are now normalized to datetime.date, but guard against None and any
         # legacy string that slipped through — None sorts to the end.
@@ -172,6 +190,61 @@ class BankStatementAnalyzer:
             pass
         return self.transactions
 
+    def _iter_extracted(self, pdf_paths, use_multiprocessing=True):
+        """Yield (pdf_path, transactions, in_worker) for each PDF, in input order.
+
+        With use_multiprocessing, PDFs are extracted by extract_one in a
+        process pool, at most two per worker ahead of the caller. If the pool
+        cannot start or breaks, the PDFs not yet yielded are extracted here
+        instead; any other error from extraction propagates.
+        """
+        pdf_paths = list(pdf_paths)
+        done = 0
+        if use_multiprocessing and len(pdf_paths) > 1:
+            import pickle
+            from collections import deque
+            from concurrent.futures import ProcessPoolExecutor
+            from concurrent.futures.process import BrokenProcessPool
+
+            workers = min(len(pdf_paths), os.cpu_count() or 1)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    upcoming = iter(pdf_paths)
+                    in_flight = deque(
+                        (pdf_path, executor.submit(extract_one, pdf_path))
+                        for pdf_path in itertools.islice(upcoming, workers * 2)
+                    )
+                    while in_flight:
+                        pdf_path, future = in_flight.popleft()
+                        txns = future.result()
+                        next_path = next(upcoming, None)
+                        if next_path is not None:
+                            in_flight.append((next_path, executor.submit(extract_one, next_path)))
+                        done += 1
+                        yield pdf_path, txns, True
+            except (BrokenProcessPool, OSError, pickle.PicklingError) as exc:
+                print(f"Parallel extraction failed, falling back to sequential: {exc}")
+        for pdf_path in pdf_paths[done:]:
+            yield pdf_path, self.extract_from_pdf(pdf_path) or [], False
+
+    def iter_categorized_transactions(self, pdf_paths, use_multiprocessing=True):
+        """Yield categorized transactions one statement at a time.
+
+        Statements are extracted through _iter_extracted (so only a few are
+        extracted ahead of the caller, and a broken pool falls back to
+        sequential extraction), then categorized and yielded, so the full
+        transaction set never has to exist as one list. Feed the result to
+        generate_schedule_c_data. self.transactions is left as it was.
+        """
+        saved = self.transactions
+        try:
+            for _pdf_path, txns, _in_worker in self._iter_extracted(pdf_paths, use_multiprocessing):
+                self.transactions = txns
+                self.categorize_transactions()
+                yield from txns
+        finally:
+            self.transactions = saved
+
     @staticmethod
     def _extract_text_from_pdf(pdf_path):
         """Extract all text from a PDF using pdfplumber."""
@@ -225,36 +298,77 @@ class BankStatementAnalyzer:
     # Output
     # ------------------------------------------------------------------
     def save_to_excel(self, output_path):
-        """Save transactions to an Excel file with category summaries."""
+        """Save transactions to an Excel file with category summaries.
+
+        Streams rows through an openpyxl write-only workbook, so no Cell
+        objects are kept for the whole sheet.
+        """
         if not self.transactions:
             print("No transactions to save.")
             return
-        rows = []
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+
+        # Header style shared by every sheet (mirrors pandas' default header)
+        header_font = Font(bold=True)
+        thin = Side(style="thin")
+        header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        header_alignment = Alignment(horizontal="center", vertical="top")
+
+        def append_header(ws, headers):
+            cells = []
+            for title in headers:
+                cell = WriteOnlyCell(ws, value=title)
+                cell.font = header_font
+                cell.border = header_border
+                cell.alignment = header_alignment
+                cells.append(cell)
+            ws.append(cells)
+
+        headers = ("Date", "Description", "Amount", "Category")
+        wb = Workbook(write_only=True)
+        all_ws = wb.create_sheet("All Transactions")
+        summary_ws = wb.create_sheet("Category Summary")
+        append_header(all_ws, headers)
+
+        rows_by_category = {}
         for t in self.transactions:
-            rows.append({
-                "Date": t.get("date"),
-                "Description": t.get("description", ""),
-                "Amount": t.get("amount", 0),
-                "Category": t.get("category", "Other Business Expenses"),
-            })
-        df = pd.DataFrame(rows)
-        try:
-            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        except Exception:
-            pass
+            category = t.get("category", "Other Business Expenses")
+            row = (
+                self._excel_date(t.get("date")),
+                t.get("description", ""),
+                t.get("amount", 0),
+                category,
+            )
+            all_ws.append(row)
+            if category is not None:
+                rows_by_category.setdefault(category, []).append(row)
+
+        # Category summary
+        append_header(summary_ws, ("Category", "Count", "Total"))
+        for cat in sorted(rows_by_category):
+            cat_rows = rows_by_category[cat]
+            summary_ws.append((cat, len(cat_rows), sum(r[2] for r in cat_rows)))
+
+        # One sheet per category
+        for cat in sorted(rows_by_category):
+            safe = re.sub(r"[^\w]", "_", str(cat))[:31]
+            cat_ws = wb.create_sheet(safe)
+            append_header(cat_ws, headers)
+            for row in rows_by_category[cat]:
+                cat_ws.append(row)
+
+        wb.save(output_path)
+        print(f"Saved {len(self.transactions)} transactions to {output_path}")
 
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="All Transactions", index=False)
-            # Category summary
-            summary = df.groupby("Category")["Amount"].agg(["count", "sum"]).reset_index()
-            summary.columns = ["Category", "Count", "Total"]
-            summary.to_excel(writer, sheet_name="Category Summary", index=False)
-            # One sheet per category
-            for cat in sorted(df["Category"].dropna().unique()):
-                cat_df = df[df["Category"] == cat]
-                safe = re.sub(r"[^\w]", "_", str(cat))[:31]
-                cat_df.to_excel(writer, sheet_name=safe, index=False)
-        print(f"Saved {len(df)} transactions to {output_path}")
+    @staticmethod
+    def _excel_date(value):
+        """Return a date/datetime Excel can store, or None if unparseable."""
+        if value is None or isinstance(value, (date, datetime)):
+            return value
+        parsed = pd.to_datetime(value, errors="coerce")
+        return None if pd.isna(parsed) else parsed.to_pydatetime()
 
     def save_to_json(self, output_path):
         """Save transactions to a JSON file."""
@@ -332,11 +446,18 @@ class BankStatementAnalyzer:
     def apply_learned_category(self, merchant, category):
         """Apply a learned merchant-to-category mapping to all matching transactions."""
         merchant_lower = merchant.lower()
-        for t in self.transactions:
-            desc = (t.get("description") or "").lower()
+        for t, desc in zip(self.transactions, self._lowered_descriptions()):
             if merchant_lower in desc and t.get("category") != category:
                 t["category"] = category
 
+    def _lowered_descriptions(self):
+        """Lowercased descriptions, rebuilt only when the transaction list changes."""
+        if (self._desc_lower_source is not self.transactions
+                or len(self._desc_lower) != len(self.transactions)):
+            self._desc_lower = [(t.get("description") or "").lower() for t in self.transactions]
+            self._desc_lower_source = self.transactions
+        return self._desc_lower
+
     # ------------------------------------------------------------------
     # AI categorization
     # ------------------------------------------------------------------
@@ -390,13 +511,15 @@ class BankStatementAnalyzer:
     # ------------------------------------------------------------------
     # Schedule C generation
     # ------------------------------------------------------------------
-    def generate_schedule_c_data(self):
+    def generate_schedule_c_data(self, transactions=None):
         """Generate Schedule C line-item data from categorized transactions.
 
+        transactions may be any iterable (e.g. iter_categorized_transactions);
+        it defaults to self.transactions and is consumed in a single pass.
         Returns a dict mapping Schedule C line descriptions to dollar totals.
         """
-        if not self.transactions:
-            return {}
+        if transactions is None:
+            transactions = self.transactions
 
         # Map category names to Schedule C line items
         schedule_c_mapping = {
@@ -425,8 +548,8 @@ class BankStatementAnalyzer:
             "Energy efficient commercial bldgs": "energy_efficient_commercial_buildings",
         }
 
-        totals = {}
-        for t in self.transactions:
+        totals = Counter()
+        for t in transactions:
             category = t.get("category", "Other Business Expenses")
             amount = t.get("amount", 0)
             try:
@@ -434,12 +557,24 @@ class BankStatementAnalyzer:
             except (TypeError, ValueError):
                 amount = 0
             line = schedule_c_mapping.get(category, "other_business_expenses")
-            totals[line] = totals.get(line, 0) + amount
+            totals[line] += amount
 
+        if not totals:
+            return {}
+        totals = dict(totals)
         totals["total_expenses"] = sum(totals.values())
         return totals
 
 
+def extract_one(pdf_path):
+    """Extract one PDF's transactions with a fresh analyzer.
+
+    Module-level so ProcessPoolExecutor can pickle it; used by
+    BankStatementAnalyzer.extract_from_multiple_pdfs.
+    """
+    return BankStatementAnalyzer().extract_from_pdf(pdf_path) or []
+
+
 def main():
     """Command-line entry point for the Bank Statement Analyzer."""
     parser = argparse.ArgumentParser(
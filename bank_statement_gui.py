@@ -9,20 +9,52 @@ import os
 import sys
 import json
 from datetime import date, datetime
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QFileDialog, QComboBox, QTableWidget, 
-    QTableWidgetItem, QTabWidget, QMessageBox, QProgressBar,
+    QPushButton, QLabel, QFileDialog, QComboBox, QTabWidget, 
+    QMessageBox, QProgressBar,
     QGroupBox, QGridLayout, QLineEdit, QTextEdit, QSplitter,
     QHeaderView, QDialog, QDialogButtonBox, QStyledItemDelegate, QCheckBox,
-    QMenu
+    QMenu, QTableView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer
-from PyQt6.QtGui import QFont, QIcon, QColor, QAction
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QSize, QTimer, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel
+)
+from PyQt6.QtGui import QFont, QIcon, QColor, QAction, QBrush
 
 from bank_statement_analyzer import BankStatementAnalyzer
 import pandas as pd
 
+# Foreground for negative amounts, shared by every table model so painting
+# never parses or allocates a color per cell
+NEGATIVE_AMOUNT_BRUSH = QBrush(QColor('red'))
+
+
+def build_display_frame(transactions):
+    """Build a column-oriented view of the transactions for table display.
+    
+    Returns a DataFrame with 'date_str' (YYYY-MM-DD for date values, str() for
+    anything else) and 'amount_str' columns, row-aligned with transactions.
+    """
+    frame = pd.DataFrame(
+        {
+            'date': [t.get('date') for t in transactions],
+            'amount': [t['amount'] for t in transactions],
+        },
+        dtype=object,
+    )
+    # The pipeline emits datetime.date, but stay defensive against strings.
+    is_date = frame['date'].map(lambda d: isinstance(d, (datetime, date))).astype(bool)
+    date_str = frame['date'].where(frame['date'].notna(), '').astype(str)
+    if is_date.any():
+        parsed = pd.to_datetime(frame['date'].where(is_date), errors='coerce')
+        date_str = date_str.mask(is_date, parsed.dt.strftime('%Y-%m-%d'))
+    frame['date_str'] = date_str
+    frame['amount_str'] = frame['amount'].map('${:.2f}'.format)
+    return frame
+
 
 class WorkerThread(QThread):
     """Worker thread for processing PDFs in the background."""
@@ -37,6 +69,7 @@ class WorkerThread(QThread):
         self.categories_path = categories_path
         self.use_ai = use_ai
         self.analyzer = None
+        self.display_frame = None
         
     def run(self):
         try:
@@ -79,6 +112,10 @@ class WorkerThread(QThread):
             use_mp = len(self.analyzer.transactions) > 10 or self.use_ai
             self.analyzer.categorize_transactions(use_multiprocessing=use_mp)
             
+            # Pre-format the display columns here so the GUI thread only
+            # copies strings into the table
+            self.display_frame = build_display_frame(self.analyzer.transactions)
+            
             # Return the transactions
             self.update_progress.emit(100)
             self.status_update.emit("✅ Processing complete!")
@@ -88,12 +125,40 @@ class WorkerThread(QThread):
             self.error.emit(str(e))
 
 
+@lru_cache(maxsize=4)
+def _sorted_categories(categories):
+    """Return the sorted category names for a frozenset of categories.
+    
+    The category set rarely changes between runs, so re-displaying results
+    reuses the sorted tuple instead of sorting again.
+    """
+    return tuple(sorted(categories))
+
+
+class ExcelExportThread(QThread):
+    """Worker thread that writes tabular data to an Excel file."""
+    export_complete = pyqtSignal(str)
+    error = pyqtSignal(str)
+    
+    def __init__(self, data, file_path):
+        super().__init__()
+        self.data = data
+        self.file_path = file_path
+    
+    def run(self):
+        try:
+            pd.DataFrame(self.data).to_excel(self.file_path, index=False)
+            self.export_complete.emit(self.file_path)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
 class CategoryComboDelegate(QStyledItemDelegate):
     """Custom delegate for category combo boxes in the transaction table."""
     
     def __init__(self, categories, parent=None):
         super().__init__(parent)
-        self.categories = sorted(categories)
+        self.categories = list(_sorted_categories(frozenset(categories)))
     
     def createEditor(self, parent, option, index):
         """Create the combo box editor."""
@@ -246,12 +311,239 @@ class CategoryEditorDialog(QDialog):
             )
 
 
+class ScheduleCTableModel(QAbstractTableModel):
+    """Read-only model over Schedule C line items.
+
+    Cells are produced on demand in data(), so the view only formats the
+    rows it actually paints instead of holding two items per line.
+    """
+    
+    HEADERS = ["Line Item", "Amount"]
+    
+    def __init__(self, schedule_c_data, parent=None):
+        super().__init__(parent)
+        self._rows = list(schedule_c_data.items())
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        line_item, amount = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return line_item if index.column() == 0 else f"${amount:.2f}"
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 1:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class CategorySummaryModel(QAbstractTableModel):
+    """Read-only model over per-category totals for the summary tab."""
+    
+    HEADERS = ["Category", "Total Amount"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def set_totals(self, category_totals):
+        """Replace the summary with a {category: amount} mapping."""
+        self.beginResetModel()
+        self._rows = list(category_totals.items())
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        category, amount = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return category if index.column() == 0 else f"${amount:.2f}"
+        if index.column() == 1:
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            # Color negative amounts red
+            if role == Qt.ItemDataRole.ForegroundRole and amount < 0:
+                return NEGATIVE_AMOUNT_BRUSH
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class TransactionsTableModel(QAbstractTableModel):
+    """Table model over the GUI's list of transaction dicts.
+    
+    The model holds a reference to the same list the analyzer works on, so
+    category edits and deletions made through it are visible everywhere.
+    Only the category column is editable; an edit emits category_edited
+    with the row and the old and new category.
+    """
+    
+    HEADERS = ["Date", "Description", "Amount", "Category"]
+    CATEGORY_COLUMN = 3
+    
+    category_edited = pyqtSignal(int, str, str)  # row, old category, new category
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.transactions = []
+        self._date_strs = []
+        self._amount_strs = []
+    
+    def set_transactions(self, transactions, display_frame=None):
+        """Replace the model contents with a new transaction list."""
+        if display_frame is None or len(display_frame) != len(transactions):
+            display_frame = build_display_frame(transactions)
+        self.beginResetModel()
+        self.transactions = transactions
+        self._date_strs = display_frame['date_str'].tolist()
+        self._amount_strs = display_frame['amount_str'].tolist()
+        self.endResetModel()
+    
+    def transaction_at(self, row):
+        """Return the transaction dict shown at a source row."""
+        return self.transactions[row]
+    
+    def remove_transaction(self, row):
+        """Remove one transaction from the model and the underlying list."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.transactions[row]
+        del self._date_strs[row]
+        del self._amount_strs[row]
+        self.endRemoveRows()
+    
+    def refresh_categories(self):
+        """Repaint the category column after categories changed externally."""
+        if self.transactions:
+            self.dataChanged.emit(
+                self.index(0, self.CATEGORY_COLUMN),
+                self.index(len(self.transactions) - 1, self.CATEGORY_COLUMN),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.transactions)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == 0:
+                return self._date_strs[row]
+            if column == 1:
+                return self.transactions[row]['description']
+            if column == 2:
+                return self._amount_strs[row]
+            return self.transactions[row]['category']
+        if column == 2:
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            # Color negative amounts red
+            if role == Qt.ItemDataRole.ForegroundRole and self.transactions[row]['amount'] < 0:
+                return NEGATIVE_AMOUNT_BRUSH
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (not index.isValid() or index.column() != self.CATEGORY_COLUMN
+                or role != Qt.ItemDataRole.EditRole):
+            return False
+        transaction = self.transactions[index.row()]
+        old_category = transaction['category']
+        if value == old_category:
+            return False
+        transaction['category'] = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self.category_edited.emit(index.row(), old_category, value)
+        return True
+    
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.CATEGORY_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class TransactionFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive description search over a TransactionsTableModel.
+    
+    Lowercased descriptions are cached whenever the source model is reset.
+    When a new query extends the previous one, only the rows that matched
+    before are re-checked, since a row that misses "tes" also misses "test".
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ''
+        self._matching_rows = None  # None means no filter is active
+        self._desc_lower = []
+    
+    def setSourceModel(self, source_model):
+        super().setSourceModel(source_model)
+        source_model.modelReset.connect(self._rebuild_cache)
+        source_model.rowsRemoved.connect(self._rebuild_cache)
+        self._rebuild_cache()
+    
+    def _rebuild_cache(self):
+        """Re-read descriptions and re-run the current query from scratch."""
+        self._desc_lower = [
+            t['description'].lower() for t in self.sourceModel().transactions
+        ]
+        query, self._query = self._query, ''
+        self._matching_rows = None
+        self.set_query(query)
+    
+    def set_query(self, text):
+        """Filter rows to those whose description contains text."""
+        query = text.lower()
+        if not query:
+            matching_rows = None
+        elif self._matching_rows is not None and query.startswith(self._query):
+            # Narrowing the previous query: only previous matches can match
+            matching_rows = {r for r in self._matching_rows if query in self._desc_lower[r]}
+        else:
+            matching_rows = {r for r, desc in enumerate(self._desc_lower) if query in desc}
+        
+        self._query = query
+        self._matching_rows = matching_rows
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._matching_rows is None or source_row in self._matching_rows
+
+
 class ScheduleCDialog(QDialog):
     """Dialog for displaying Schedule C data."""
     
     def __init__(self, schedule_c_data, parent=None):
         super().__init__(parent)
         self.schedule_c_data = schedule_c_data
+        self.export_thread = None
         self.setWindowTitle("Schedule C Data")
         self.setMinimumSize(600, 500)
         self.setup_ui()
@@ -267,30 +559,23 @@ class ScheduleCDialog(QDialog):
         instructions.setWordWrap(True)
         layout.addWidget(instructions)
         
-        # Schedule C table
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Line Item", "Amount"])
+        # Schedule C table (model-backed; rows are formatted lazily)
+        self.table = QTableView()
+        self.table.setModel(ScheduleCTableModel(self.schedule_c_data, self.table))
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         
-        # Populate table
-        self.table.setRowCount(len(self.schedule_c_data))
-        for i, (line_item, amount) in enumerate(self.schedule_c_data.items()):
-            # Line item
-            line_item_widget = QTableWidgetItem(line_item)
-            self.table.setItem(i, 0, line_item_widget)
-            
-            # Amount
-            amount_widget = QTableWidgetItem(f"${amount:.2f}")
-            amount_widget.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(i, 1, amount_widget)
-        
         layout.addWidget(self.table)
         
         # Export button
-        export_btn = QPushButton("Export to Excel")
-        export_btn.clicked.connect(self.export_to_excel)
-        layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export to Excel")
+        self.export_btn.clicked.connect(self.export_to_excel)
+        layout.addWidget(self.export_btn)
+        
+        # Busy indicator shown while an export is being written
+        self.export_progress = QProgressBar()
+        self.export_progress.setRange(0, 0)
+        self.export_progress.setVisible(False)
+        layout.addWidget(self.export_progress)
         
         # Close button
         close_btn = QPushButton("Close")
@@ -308,27 +593,45 @@ class ScheduleCDialog(QDialog):
             if not file_path.endswith('.xlsx'):
                 file_path += '.xlsx'
             
-            try:
-                # Create DataFrame and export to Excel
-                data = {'Line Item': [], 'Amount': []}
-                for line_item, amount in self.schedule_c_data.items():
-                    data['Line Item'].append(line_item)
-                    data['Amount'].append(amount)
-                
-                df = pd.DataFrame(data)
-                df.to_excel(file_path, index=False)
-                
-                QMessageBox.information(
-                    self, 
-                    "Export Complete", 
-                    f"Schedule C data exported to {file_path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(
-                    self, 
-                    "Export Error", 
-                    f"Failed to export Schedule C data: {e}"
-                )
+            # Create the export data; the workbook is written off the GUI thread
+            data = {
+                'Line Item': list(self.schedule_c_data.keys()),
+                'Amount': list(self.schedule_c_data.values()),
+            }
+            
+            self.export_btn.setEnabled(False)
+            self.export_progress.setVisible(True)
+            
+            self.export_thread = ExcelExportThread(data, file_path)
+            self.export_thread.export_complete.connect(self.on_export_complete)
+            self.export_thread.error.connect(self.on_export_error)
+            self.export_thread.start()
+    
+    def on_export_complete(self, file_path):
+        """Handle a finished background export."""
+        self.export_progress.setVisible(False)
+        self.export_btn.setEnabled(True)
+        QMessageBox.information(
+            self, 
+            "Export Complete", 
+            f"Schedule C data exported to {file_path}"
+        )
+    
+    def on_export_error(self, error_msg):
+        """Handle a failed background export."""
+        self.export_progress.setVisible(False)
+        self.export_btn.setEnabled(True)
+        QMessageBox.critical(
+            self, 
+            "Export Error", 
+            f"Failed to export Schedule C data: {error_msg}"
+        )
+    
+    def done(self, result):
+        """Let a running export finish before the dialog goes away."""
+        if self.export_thread is not None and self.export_thread.isRunning():
+            self.export_thread.wait()
+        super().done(result)
 
 
 class BankStatementGUI(QMainWindow):
@@ -345,7 +648,6 @@ class BankStatementGUI(QMainWindow):
         self.output_path = "categorized_transactions.xlsx"
         self.transactions = []
         self.current_analyzer = None
-        self.transaction_indices = {}  # Map to track transaction indices in the table
         self.ai_settings_path = "config/ai_settings.json"
         self.ai_settings = self._load_ai_settings()
         
@@ -545,7 +847,12 @@ class BankStatementGUI(QMainWindow):
         search_label = QLabel("Search Transactions:")
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Enter text to search in transaction descriptions...")
-        self.search_input.textChanged.connect(self.search_transactions)
+        self.search_input.textChanged.connect(self.schedule_search)
+        # Debounce typing so a burst of keystrokes costs one filter pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)
+        self._search_timer.timeout.connect(self.search_transactions)
         self.search_clear_btn = QPushButton("Clear")
         self.search_clear_btn.clicked.connect(self.clear_search)
         
@@ -563,17 +870,24 @@ class BankStatementGUI(QMainWindow):
         transaction_buttons_layout.addStretch()  # Push button to the left
         all_transactions_layout.addLayout(transaction_buttons_layout)
         
-        # All transactions table
-        self.all_transactions_table = QTableWidget()
-        self.all_transactions_table.setColumnCount(4)
-        self.all_transactions_table.setHorizontalHeaderLabels(["Date", "Description", "Amount", "Category"])
+        # All transactions table: a view over the transactions model, with a
+        # proxy that filters on the description column for search
+        self.transactions_model = TransactionsTableModel(self)
+        self.transactions_model.category_edited.connect(self.on_category_changed)
+        self.transactions_proxy = TransactionFilterProxyModel(self)
+        self.transactions_proxy.setSourceModel(self.transactions_model)
+        
+        self.all_transactions_table = QTableView()
+        self.all_transactions_table.setModel(self.transactions_proxy)
         self.all_transactions_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        # Uniform row heights: the view never measures rows to lay them out
+        self.all_transactions_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
         # Enable context menu and selection
         self.all_transactions_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.all_transactions_table.customContextMenuRequested.connect(self.show_transaction_context_menu)
-        self.all_transactions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.all_transactions_table.itemSelectionChanged.connect(self.on_transaction_selection_changed)
+        self.all_transactions_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.all_transactions_table.selectionModel().selectionChanged.connect(self.on_transaction_selection_changed)
         
         all_transactions_layout.addWidget(self.all_transactions_table)
         
@@ -581,9 +895,9 @@ class BankStatementGUI(QMainWindow):
         self.tabs.addTab(self.all_transactions_tab, "All Transactions")
         
         # Category summary tab
-        self.category_summary_table = QTableWidget()
-        self.category_summary_table.setColumnCount(2)
-        self.category_summary_table.setHorizontalHeaderLabels(["Category", "Total Amount"])
+        self.category_summary_model = CategorySummaryModel(self)
+        self.category_summary_table = QTableView()
+        self.category_summary_table.setModel(self.category_summary_model)
         self.category_summary_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.tabs.addTab(self.category_summary_table, "Category Summary")
         
@@ -643,9 +957,11 @@ class BankStatementGUI(QMainWindow):
             self, "Select Folder Containing Bank Statement PDFs"
         )
         if folder_path:
-            # Find all PDF files in the folder
-            pdf_files = [os.path.join(folder_path, f) for f in os.listdir(folder_path) 
-                        if f.lower().endswith('.pdf')]
+            # Find all PDF files in the folder (scandir yields ready-made
+            # paths and cached file-type info, so no extra stat/join per entry)
+            with os.scandir(folder_path) as entries:
+                pdf_files = [entry.path for entry in entries
+                             if entry.name[-4:].lower() == '.pdf' and entry.is_file()]
             
             if pdf_files:
                 self.pdf_paths = pdf_files
@@ -778,55 +1094,25 @@ class BankStatementGUI(QMainWindow):
         self.save_btn.setEnabled(True)
         self.schedule_c_btn.setEnabled(True)
         
-        # Get all available categories
-        all_categories = sorted(list(self.analyzer.categories.keys()))
-        
-        # Set up the category delegate for the table
-        category_delegate = CategoryComboDelegate(all_categories, self.all_transactions_table)
+        # Set up the category delegate for the table (it sorts the names)
+        category_delegate = CategoryComboDelegate(self.analyzer.categories.keys(), self.all_transactions_table)
         self.all_transactions_table.setItemDelegateForColumn(3, category_delegate)
         
-        # Populate the all transactions table
-        self.all_transactions_table.setRowCount(len(transactions))
-        self.transaction_indices = {}  # Reset the transaction indices map
-        
-        for i, transaction in enumerate(transactions):
-            # Store the transaction index for later reference
-            self.transaction_indices[i] = transaction
-            
-            # Date — normalize to YYYY-MM-DD regardless of underlying type
-            # (pipeline emits datetime.date, but stay defensive against strings).
-            raw_date = transaction.get('date')
-            if isinstance(raw_date, (datetime, date)):
-                date_str = raw_date.strftime('%Y-%m-%d')
-            elif raw_date:
-                date_str = str(raw_date)
-            else:
-                date_str = ''
-            date_item = QTableWidgetItem(date_str)
-            self.all_transactions_table.setItem(i, 0, date_item)
-            
-            # Description
-            desc_item = QTableWidgetItem(transaction['description'])
-            self.all_transactions_table.setItem(i, 1, desc_item)
-            
-            # Amount
-            amount_item = QTableWidgetItem(f"${transaction['amount']:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            # Color negative amounts red
-            if transaction['amount'] < 0:
-                amount_item.setForeground(QColor('red'))
-            self.all_transactions_table.setItem(i, 2, amount_item)
+        # Hold repaints until both tables are repopulated
+        self.all_transactions_table.setUpdatesEnabled(False)
+        self.category_summary_table.setUpdatesEnabled(False)
+        try:
+            # Populate the all transactions table. Date/amount strings were
+            # formatted by the worker (see build_display_frame).
+            self.transactions_model.set_transactions(
+                transactions, getattr(self.worker, 'display_frame', None)
+            )
             
-            # Category
-            category_item = QTableWidgetItem(transaction['category'])
-            category_item.setFlags(category_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.all_transactions_table.setItem(i, 3, category_item)
-        
-        # Connect to the cell changed signal
-        self.all_transactions_table.cellChanged.connect(self.on_category_changed)
-        
-        # Calculate and display category summary
-        self.update_category_summary()
+            # Calculate and display category summary
+            self.update_category_summary()
+        finally:
+            self.category_summary_table.setUpdatesEnabled(True)
+            self.all_transactions_table.setUpdatesEnabled(True)
         
         # Re-enable the process button
         self.process_btn.setEnabled(True)
@@ -838,22 +1124,12 @@ class BankStatementGUI(QMainWindow):
             f"Successfully processed {len(transactions)} transactions from {len(self.pdf_paths)} PDF file(s)."
         )
     
-    def on_category_changed(self, row, column):
-        """Handle changes to transaction categories."""
-        # Only process changes to the category column
-        if column != 3 or not self.analyzer:
+    def on_category_changed(self, row, old_category, new_category):
+        """Handle changes to transaction categories made in the table."""
+        if not self.analyzer:
             return
-            
-        # Get the new category and transaction
-        new_category = self.all_transactions_table.item(row, 3).text()
-        transaction = self.transaction_indices.get(row)
         
-        if not transaction:
-            return
-            
-        # Update the transaction's category
-        old_category = transaction['category']
-        transaction['category'] = new_category
+        transaction = self.transactions_model.transaction_at(row)
         
         # Ask if user wants to apply this change to similar transactions
         if old_category != new_category:
@@ -888,17 +1164,9 @@ class BankStatementGUI(QMainWindow):
     
     def refresh_transaction_table(self):
         """Refresh the transaction table to reflect category changes."""
-        # Temporarily disconnect the cellChanged signal to avoid recursive calls
-        self.all_transactions_table.cellChanged.disconnect(self.on_category_changed)
-        
-        # Update the categories in the table
-        for row, transaction in self.transaction_indices.items():
-            category_item = self.all_transactions_table.item(row, 3)
-            if category_item and category_item.text() != transaction['category']:
-                category_item.setText(transaction['category'])
-        
-        # Reconnect the signal
-        self.all_transactions_table.cellChanged.connect(self.on_category_changed)
+        # The model reads categories straight from the transaction dicts,
+        # so the view only needs to repaint the category column
+        self.transactions_model.refresh_categories()
     
     def update_category_summary(self):
         """Update the category summary table based on current transactions."""
@@ -914,19 +1182,7 @@ class BankStatementGUI(QMainWindow):
             category_totals[category] += transaction['amount']
         
         # Populate the category summary table
-        self.category_summary_table.setRowCount(len(category_totals))
-        for i, (category, amount) in enumerate(category_totals.items()):
-            # Category
-            category_item = QTableWidgetItem(category)
-            self.category_summary_table.setItem(i, 0, category_item)
-            
-            # Amount
-            amount_item = QTableWidgetItem(f"${amount:.2f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            # Color negative amounts red
-            if amount < 0:
-                amount_item.setForeground(QColor('red'))
-            self.category_summary_table.setItem(i, 1, amount_item)
+        self.category_summary_model.set_totals(category_totals)
     
     def show_schedule_c(self):
         """Generate and display Schedule C data."""
@@ -978,31 +1234,29 @@ class BankStatementGUI(QMainWindow):
                 f"Failed to save Excel file: {e}"
             )
     
+    def schedule_search(self):
+        """Restart the search debounce timer after the search text changes."""
+        self._search_timer.start()
+    
     def search_transactions(self):
         """Search transactions based on the search input."""
-        search_text = self.search_input.text().lower()
-        
-        # Show all rows if search is empty
-        if not search_text:
-            for row in range(self.all_transactions_table.rowCount()):
-                self.all_transactions_table.setRowHidden(row, False)
-            return
-        
-        # Hide rows that don't match the search
-        for row in range(self.all_transactions_table.rowCount()):
-            description_item = self.all_transactions_table.item(row, 1)
-            if description_item:
-                description = description_item.text().lower()
-                if search_text in description:
-                    self.all_transactions_table.setRowHidden(row, False)
-                else:
-                    self.all_transactions_table.setRowHidden(row, True)
+        # The proxy only re-checks previous matches while the query grows;
+        # an empty string shows all rows
+        self.transactions_proxy.set_query(self.search_input.text())
     
     def clear_search(self):
         """Clear the search input and show all transactions."""
         self.search_input.clear()
-        for row in range(self.all_transactions_table.rowCount()):
-            self.all_transactions_table.setRowHidden(row, False)
+        # Show everything right away rather than after the debounce delay
+        self._search_timer.stop()
+        self.search_transactions()
+    
+    def selected_transaction_rows(self):
+        """Return the source-model rows of the selected transactions."""
+        return [
+            self.transactions_proxy.mapToSource(index).row()
+            for index in self.all_transactions_table.selectionModel().selectedRows()
+        ]
     
     def on_transaction_selection_changed(self):
         """Handle transaction selection changes."""
@@ -1011,7 +1265,7 @@ class BankStatementGUI(QMainWindow):
     
     def show_transaction_context_menu(self, position):
         """Show context menu for transaction table."""
-        if self.all_transactions_table.itemAt(position) is None:
+        if not self.all_transactions_table.indexAt(position).isValid():
             return
         
         context_menu = QMenu(self)
@@ -1024,36 +1278,33 @@ class BankStatementGUI(QMainWindow):
         selected_rows = self.all_transactions_table.selectionModel().selectedRows()
         delete_action.setEnabled(len(selected_rows) > 0)
         
-        context_menu.exec(self.all_transactions_table.mapToGlobal(position))
+        context_menu.exec(self.all_transactions_table.viewport().mapToGlobal(position))
     
     def delete_selected_transaction(self):
         """Delete the selected transaction."""
-        selected_rows = self.all_transactions_table.selectionModel().selectedRows()
+        selected_rows = self.selected_transaction_rows()
         
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select a transaction to delete.")
             return
         
         # Get the selected row
-        row = selected_rows[0].row()
+        row = selected_rows[0]
         
         # Get transaction details for confirmation
-        date_item = self.all_transactions_table.item(row, 0)
-        desc_item = self.all_transactions_table.item(row, 1)
-        amount_item = self.all_transactions_table.item(row, 2)
-        
-        if not all([date_item, desc_item, amount_item]):
-            QMessageBox.warning(self, "Error", "Unable to retrieve transaction details.")
-            return
+        model = self.transactions_model
+        date_text = model.data(model.index(row, 0))
+        desc_text = model.data(model.index(row, 1))
+        amount_text = model.data(model.index(row, 2))
         
         # Confirm deletion
         reply = QMessageBox.question(
             self,
             "Confirm Deletion",
             f"Are you sure you want to delete this transaction?\n\n"
-            f"Date: {date_item.text()}\n"
-            f"Description: {desc_item.text()}\n"
-            f"Amount: {amount_item.text()}",
+            f"Date: {date_text}\n"
+            f"Description: {desc_text}\n"
+            f"Amount: {amount_text}",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
@@ -1062,25 +1313,11 @@ class BankStatementGUI(QMainWindow):
             self.delete_transaction(row)
     
     def delete_transaction(self, row):
-        """Delete a specific transaction by row."""
+        """Delete a specific transaction by source-model row."""
         try:
-            # Remove from the transactions list
-            if row in self.transaction_indices:
-                transaction_to_remove = self.transaction_indices[row]
-                
-                # Find and remove from the main transactions list
-                for i, transaction in enumerate(self.transactions):
-                    if (transaction['date'] == transaction_to_remove['date'] and
-                        transaction['description'] == transaction_to_remove['description'] and
-                        transaction['amount'] == transaction_to_remove['amount']):
-                        self.transactions.pop(i)
-                        break
-                
-                # Remove from the table
-                self.all_transactions_table.removeRow(row)
-                
-                # Rebuild the transaction indices mapping
-                self.rebuild_transaction_indices()
+            if 0 <= row < self.transactions_model.rowCount():
+                # Remove from the table and the transactions list it wraps
+                self.transactions_model.remove_transaction(row)
                 
                 # Update the category summary
                 self.update_category_summary()
@@ -1096,13 +1333,6 @@ class BankStatementGUI(QMainWindow):
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to delete transaction: {str(e)}")
-    
-    def rebuild_transaction_indices(self):
-        """Rebuild the transaction indices mapping after deletion."""
-        self.transaction_indices = {}
-        for row in range(self.all_transactions_table.rowCount()):
-            if row < len(self.transactions):
-                self.transaction_indices[row] = self.transactions[row]
 
 
 def main():
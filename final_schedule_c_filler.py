@@ -8,18 +8,46 @@ Uses the corrected field mappings based on actual PDF positions.
 import fitz  # PyMuPDF
 import json
 import os
+import re
+from collections import Counter
 from bank_statement_analyzer import BankStatementAnalyzer
 
 
+def iter_pdfs(directory):
+    """Yield paths of the PDF files directly inside directory."""
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith('.pdf') and entry.is_file():
+                yield entry.path
+
+
+def _field_pattern_hook(pairs):
+    """json object_pairs_hook: collapse each mapping entry to its field_pattern.
+    
+    Entries like {"line": "28", "field_pattern": "f1_41", ...} become just
+    "f1_41" while parsing, so no per-entry dict is built and walked later.
+    """
+    for key, value in pairs:
+        if key == "field_pattern":
+            return value
+    return dict(pairs)
+
+
 class FinalScheduleCFiller:
     """Final Schedule C PDF filler with corrected field mappings."""
     
-    def __init__(self, pdf_path="config/schedule_c.pdf", mapping_file="config/schedule_c_field_mappings.json"):
+    def __init__(self, pdf_path="config/schedule_c.pdf", mapping_file="config/schedule_c_field_mappings.json",
+                 structure_cache="config/.schedule_c_structure.json"):
         self.pdf_path = pdf_path
         self.mapping_file = mapping_file
+        self.structure_cache = structure_cache
         self.form_fields = {}
         self.schedule_c_data = {}
         self.field_mappings = {}
+        self._field_by_pattern = {}  # field pattern -> first matching Text field name
+        self._pattern_re = None  # alternation of every mapped field pattern
         
         # Load field mappings from JSON file
         self.load_field_mappings()
@@ -45,13 +73,12 @@ class FinalScheduleCFiller:
             if os.path.exists(self.mapping_file):
                 print(f"📄 Loading field mappings from {self.mapping_file}")
                 with open(self.mapping_file, 'r') as f:
-                    data = json.load(f)
+                    data = json.load(f, object_pairs_hook=_field_pattern_hook)
                 
-                # Extract field mappings from JSON structure
+                # Mapping entries were reduced to their field_pattern during parsing
                 if "schedule_c_mappings" in data:
-                    for category, info in data["schedule_c_mappings"].items():
-                        field_pattern = info.get("field_pattern", "")
-                        if field_pattern:
+                    for category, field_pattern in data["schedule_c_mappings"].items():
+                        if isinstance(field_pattern, str) and field_pattern:
                             self.field_mappings[category] = field_pattern
                     print(f"✅ Loaded {len(self.field_mappings)} mappings from JSON")
                 else:
@@ -66,11 +93,55 @@ class FinalScheduleCFiller:
             self.field_mappings = default_mappings
         
         print(f"📋 Using {len(self.field_mappings)} field mappings")
+        
+        # One compiled alternation lets field names that contain no mapped
+        # pattern be skipped with a single C-level scan
+        patterns = sorted(set(self.field_mappings.values()), key=len, reverse=True)
+        self._pattern_re = re.compile('|'.join(map(re.escape, patterns))) if patterns else None
+    
+    def _pdf_cache_key(self):
+        """Identify the PDF revision: absolute path plus modification time."""
+        return {
+            'pdf_path': os.path.abspath(self.pdf_path),
+            'mtime_ns': os.stat(self.pdf_path).st_mtime_ns,
+        }
+    
+    def _load_cached_structure(self):
+        """Load form fields saved for this exact PDF revision, if any."""
+        try:
+            if os.path.exists(self.structure_cache):
+                with open(self.structure_cache, 'r') as f:
+                    data = json.load(f)
+                if data.get('key') == self._pdf_cache_key():
+                    return data.get('form_fields')
+        except Exception as e:
+            print(f"⚠️ Ignoring PDF structure cache: {e}")
+        return None
+    
+    def _save_cached_structure(self):
+        """Save the extracted form fields for reuse on the next run."""
+        try:
+            with open(self.structure_cache, 'w') as f:
+                json.dump({'key': self._pdf_cache_key(), 'form_fields': self.form_fields}, f)
+        except Exception as e:
+            print(f"⚠️ Could not save PDF structure cache: {e}")
     
     def analyze_pdf_structure(self):
-        """Extract all form fields from the PDF."""
+        """Extract all form fields from the PDF.
+        
+        Field names, types, values and pages are cached in structure_cache
+        keyed by the PDF's path and mtime, so an unchanged form is not
+        re-parsed. Live widgets are looked up when filling.
+        """
         print("🔍 Analyzing PDF form structure...")
         
+        cached = self._load_cached_structure() if os.path.exists(self.pdf_path) else None
+        if cached is not None:
+            self.form_fields = cached
+            print(f"✅ Loaded {len(self.form_fields)} form fields from cache")
+            self._resolve_field_patterns()
+            return True
+        
         try:
             doc = fitz.open(self.pdf_path)
             
@@ -89,12 +160,13 @@ class FinalScheduleCFiller:
                         self.form_fields[field_name] = {
                             'type': field_type,
                             'value': field_value,
-                            'page': page_num,
-                            'widget': widget
+                            'page': page_num
                         }
             
             doc.close()
             print(f"✅ Extracted {len(self.form_fields)} form fields")
+            self._save_cached_structure()
+            self._resolve_field_patterns()
             return True
             
         except Exception as e:
@@ -108,21 +180,22 @@ class FinalScheduleCFiller:
         analyzer = BankStatementAnalyzer()
         
         try:
-            import glob
-            pdf_files = glob.glob("Statements/*.pdf")
+            pdf_files = list(iter_pdfs("Statements"))
             if pdf_files:
                 print(f"📊 Processing {len(pdf_files)} bank statements...")
-                analyzer.extract_from_multiple_pdfs(pdf_files[:10])
-                analyzer.categorize_transactions()
-                self.schedule_c_data = analyzer.generate_schedule_c_data()
+                # Statements are extracted and categorized one at a time and
+                # folded straight into the Schedule C totals
+                self.schedule_c_data = analyzer.generate_schedule_c_data(
+                    analyzer.iter_categorized_transactions(pdf_files)
+                )
                 
                 if self.schedule_c_data:
                     total = self.schedule_c_data.get('Total expenses', 0)
                     print(f"✅ Generated Schedule C data: ${total:,.2f} total expenses")
                     
-                    # Show categories and their field mappings
+                    # Show categories and their field mappings, largest first
                     print("📋 Expense categories and field mappings:")
-                    for category, amount in self.schedule_c_data.items():
+                    for category, amount in Counter(self.schedule_c_data).most_common():
                         if amount > 0 and category in self.field_mappings:
                             field_pattern = self.field_mappings[category]
                             print(f"  • {category}: ${amount:,.2f} → {field_pattern}")
@@ -134,8 +207,26 @@ class FinalScheduleCFiller:
         
         return False
     
+    def _resolve_field_patterns(self):
+        """Resolve every mapped field pattern to a PDF field name in one pass."""
+        self._field_by_pattern = {}
+        if self._pattern_re is None:
+            return
+        unresolved = set(self.field_mappings.values())
+        for field_name, field_info in self.form_fields.items():
+            if field_info['type'] != 'Text' or not self._pattern_re.search(field_name):
+                continue
+            # A field name can contain several patterns (e.g. f1_2 and f1_24)
+            for pattern in [p for p in unresolved if p in field_name]:
+                self._field_by_pattern[pattern] = field_name
+                unresolved.discard(pattern)
+            if not unresolved:
+                break
+    
     def find_matching_field(self, field_pattern):
         """Find the actual PDF field name that matches the pattern."""
+        if field_pattern in self._field_by_pattern:
+            return self._field_by_pattern[field_pattern]
         for field_name, field_info in self.form_fields.items():
             if field_info['type'] == 'Text' and field_pattern in field_name:
                 return field_name
@@ -147,14 +238,23 @@ class FinalScheduleCFiller:
         
         try:
             doc = fitz.open(self.pdf_path)
-            filled_count = 0
+            # field name -> (widget, formatted value); widgets are written in
+            # one pass after all values are known, once per field
+            pending = {}
+            # page number -> {field name: widget}, built once per page on first use
+            # (pages are kept alive alongside, since widgets need a bound page)
+            pages = {}
+            widgets_by_page = {}
             
             print("\n📋 Filling Schedule C with field mappings:")
             
-            for category, amount in self.schedule_c_data.items():
-                if amount <= 0 or category not in self.field_mappings:
-                    continue
-                
+            # Only positive amounts with a mapped field need any PDF work
+            items = [
+                (category, amount) for category, amount in self.schedule_c_data.items()
+                if amount > 0 and category in self.field_mappings
+            ]
+            
+            for category, amount in items:
                 field_pattern = self.field_mappings[category]
                 matching_field = self.find_matching_field(field_pattern)
                 
@@ -162,23 +262,30 @@ class FinalScheduleCFiller:
                     field_info = self.form_fields[matching_field]
                     
                     # Find and fill the field
-                    page = doc[field_info['page']]
-                    widgets = list(page.widgets())
+                    page_num = field_info['page']
+                    page_widgets = widgets_by_page.get(page_num)
+                    if page_widgets is None:
+                        pages[page_num] = doc[page_num]
+                        page_widgets = {}
+                        for widget in pages[page_num].widgets():
+                            page_widgets.setdefault(widget.field_name, widget)
+                        widgets_by_page[page_num] = page_widgets
                     
-                    for widget in widgets:
-                        if widget.field_name == matching_field:
-                            # Format amount appropriately
-                            formatted_amount = f"{amount:,.0f}"
-                            
-                            widget.field_value = formatted_amount
-                            widget.update()
-                            filled_count += 1
-                            
-                            print(f"✅ {category}: ${amount:,.2f} → {field_pattern} ({matching_field})")
-                            break
+                    widget = page_widgets.get(matching_field)
+                    if widget is not None:
+                        # Format amount appropriately
+                        pending[matching_field] = (widget, f"{amount:,.0f}")
+                        
+                        print(f"✅ {category}: ${amount:,.2f} → {field_pattern} ({matching_field})")
                 else:
                     print(f"❌ Could not find field for {category} (pattern: {field_pattern})")
             
+            # Write the values; each update() regenerates the widget appearance
+            for widget, formatted_amount in pending.values():
+                widget.field_value = formatted_amount
+                widget.update()
+            filled_count = len(pending)
+            
             # Save the filled PDF
             doc.save(output_path)
             doc.close()
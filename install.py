@@ -91,7 +91,9 @@ class StatementOrganizerInstaller:
         print(f"📥 Downloading Python {self.python_version} from {url}")
         
         try:
-            urllib.request.urlretrieve(url, filepath)
+            # Stream straight to disk with a 1 MiB buffer
+            with urllib.request.urlopen(url) as response, open(filepath, "wb") as f:
+                shutil.copyfileobj(response, f, length=1 << 20)
             print(f"✅ Downloaded to {filepath}")
             
             if os_type == "windows":
@@ -125,15 +127,24 @@ class StatementOrganizerInstaller:
             # Try to use pip3 first, then pip
             pip_cmd = "pip3" if shutil.which("pip3") else "pip"
             
-            for package in requirements:
-                print(f"   Installing {package}...")
-                result = subprocess.run([pip_cmd, "install", package], 
-                                      capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"⚠️ Warning: Failed to install {package}")
-                    print(f"   Error: {result.stderr}")
-                else:
-                    print(f"   ✅ {package} installed successfully")
+            # One pip invocation resolves and downloads everything together
+            print(f"   Installing {', '.join(requirements)}...")
+            result = subprocess.run([pip_cmd, "install", *requirements],
+                                  capture_output=True, text=True)
+            if result.returncode == 0:
+                print(f"   ✅ {len(requirements)} packages installed successfully")
+            else:
+                # Retry one at a time to report which package failed
+                print("⚠️ Batch install failed, retrying packages individually...")
+                for package in requirements:
+                    print(f"   Installing {package}...")
+                    result = subprocess.run([pip_cmd, "install", package], 
+                                          capture_output=True, text=True)
+                    if result.returncode != 0:
+                        print(f"⚠️ Warning: Failed to install {package}")
+                        print(f"   Error: {result.stderr}")
+                    else:
+                        print(f"   ✅ {package} installed successfully")
             
             print("✅ Package installation complete")
             return True
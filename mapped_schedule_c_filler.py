@@ -81,9 +81,11 @@ class MappedScheduleCFiller:
             pdf_files = glob.glob("Statements/*.pdf")
             if pdf_files:
                 print(f"📊 Processing {len(pdf_files)} bank statements...")
-                analyzer.extract_from_multiple_pdfs(pdf_files[:10])
-                analyzer.categorize_transactions()
-                self.schedule_c_data = analyzer.generate_schedule_c_data()
+                # Statements are extracted and categorized one at a time and
+                # folded straight into the Schedule C totals
+                self.schedule_c_data = analyzer.generate_schedule_c_data(
+                    analyzer.iter_categorized_transactions(pdf_files)
+                )
                 
                 if self.schedule_c_data:
                     total = self.schedule_c_data.get('Total expenses', 0)
@@ -8,49 +8,225 @@ Interactive GUI to display PDF with field overlays and create mapping configurat
 import sys
 import json
 import os
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QLabel, QComboBox, 
                             QListWidget, QListWidgetItem, QScrollArea, 
                             QFileDialog, QMessageBox, QSplitter, QTextEdit,
                             QTreeWidget, QTreeWidgetItem, QGroupBox)
-from PyQt6.QtCore import Qt, QRect, pyqtSignal
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QColor, QFont
-import fitz  # PyMuPDF
-from PIL import Image
-import tempfile
+from PyQt6.QtCore import Qt, QRect, QPoint, pyqtSignal, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QBrush, QColor, QFont
+import numpy as np
 
 
 class ClickableLabel(QLabel):
-    """Custom QLabel that emits click signals with coordinates."""
+    """Custom QLabel that emits click signals with coordinates.
+    
+    Field overlays are painted on top of the page pixmap in paintEvent,
+    limited to the exposed region, so the page pixmap itself is never
+    copied or modified.
+    """
     
     clicked = pyqtSignal(int, int, str)  # x, y, field_name
     
+    HIT_CELL_SHIFT = 4  # Hit-test grid cells are 16x16 px
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.field_overlays = []
+        self.field_overlays = []  # (field_name, QRect, label position) in pixmap coordinates
         self.selected_field = None
+        self.hit_testing_enabled = False
+        self._overlay_rects = {}  # field_name -> QRect, for selection repaints
+        # (cell x, cell y) -> indices into field_overlays, in overlay order
+        self._hit_grid = {}
+        
+        # Drawing resources, built once rather than on every paint
+        self._outline_pen = QPen(QColor(255, 0, 0), 2)  # Red pen
+        self._selected_pen = QPen(QColor(0, 0, 255), 3)  # Blue for selected
+        self._selected_brush = QBrush(QColor(0, 0, 255, 50))  # Light blue fill
+        self._label_pen = QPen(QColor(255, 0, 0), 1)
+        self._label_font = QFont("Arial", 8)
         
     def set_field_overlays(self, overlays):
-        """Set the field overlay data."""
+        """Set the field overlay data and bucket it into the hit-test grid."""
         self.field_overlays = overlays
+        self.selected_field = None
+        self._overlay_rects = {field_name: rect for field_name, rect, _pos in overlays}
+        self._hit_grid = {}
+        shift = self.HIT_CELL_SHIFT
+        for index, (_field_name, rect, _label_pos) in enumerate(overlays):
+            for gx in range(rect.left() >> shift, (rect.right() >> shift) + 1):
+                for gy in range(rect.top() >> shift, (rect.bottom() >> shift) + 1):
+                    self._hit_grid.setdefault((gx, gy), []).append(index)
+        self.update()
+        
+    def set_selected_field(self, field_name):
+        """Highlight one field, repainting only the old and new selection."""
+        dirty = [self._overlay_rects[name] for name in (self.selected_field, field_name)
+                 if name in self._overlay_rects]
+        self.selected_field = field_name
+        offset = self.pixmap_offset()
+        for rect in dirty:
+            # Pad for the 3 px selection pen
+            self.update(rect.translated(offset).adjusted(-3, -3, 3, 3))
+        
+    def set_hit_testing_enabled(self, enabled):
+        """Turn field hit-testing of mouse clicks on or off."""
+        self.hit_testing_enabled = enabled
+        
+    def pixmap_offset(self):
+        """Top-left of the (centered) pixmap inside the label."""
+        pixmap = self.pixmap()
+        contents = self.contentsRect()
+        if pixmap is None or pixmap.isNull():
+            return contents.topLeft()
+        return contents.topLeft() + QPoint(max(0, (contents.width() - pixmap.width()) // 2),
+                                           max(0, (contents.height() - pixmap.height()) // 2))
+        
+    def paintEvent(self, event):
+        """Blit the page, then draw the overlays that intersect the exposed area."""
+        super().paintEvent(event)
+        if not self.field_overlays:
+            return
+        
+        offset = self.pixmap_offset()
+        clip = event.rect().translated(-offset)
+        visible = [overlay for overlay in self.field_overlays if clip.intersects(overlay[1])]
+        if not visible:
+            return
+        
+        painter = QPainter(self)
+        try:
+            painter.translate(offset)
+            painter.setPen(self._outline_pen)
+            painter.drawRects([rect for _name, rect, _pos in visible])
+            
+            for name, rect, _pos in visible:
+                if name == self.selected_field:
+                    painter.setPen(self._selected_pen)
+                    painter.setBrush(self._selected_brush)
+                    painter.drawRect(rect)
+            
+            # Draw field names
+            painter.setPen(self._label_pen)
+            painter.setFont(self._label_font)
+            for name, _rect, label_pos in visible:
+                painter.drawText(*label_pos, name)
+        finally:
+            painter.end()
         
     def mousePressEvent(self, event):
         """Handle mouse clicks to detect field selection."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            x, y = event.position().x(), event.position().y()
-            
-            # Check which field was clicked
-            for field_name, rect in self.field_overlays:
-                if rect.contains(int(x), int(y)):
-                    self.clicked.emit(int(x), int(y), field_name)
+        if (self.hit_testing_enabled and self.field_overlays
+                and event.button() == Qt.MouseButton.LeftButton):
+            offset = self.pixmap_offset()
+            x = int(event.position().x()) - offset.x()
+            y = int(event.position().y()) - offset.y()
+            
+            # Check only the fields bucketed under the clicked cell
+            cell = (x >> self.HIT_CELL_SHIFT, y >> self.HIT_CELL_SHIFT)
+            for index in self._hit_grid.get(cell, ()):
+                field_name, rect, _label_pos = self.field_overlays[index]
+                if rect.contains(x, y):
+                    self.clicked.emit(x, y, field_name)
                     return
         
         super().mousePressEvent(event)
 
 
+VECTORIZE_MIN_RECTS = 64  # Below this, NumPy setup costs more than it saves
+
+
+def _scale_rects(rects, zoom):
+    """Scale fitz rects to integer (x, y, width, height) tuples at zoom."""
+    if len(rects) > VECTORIZE_MIN_RECTS:
+        coords = np.array([(r.x0, r.y0, r.x1, r.y1) for r in rects], dtype=np.float64)
+        coords[:, 2:] -= coords[:, :2]  # x1, y1 -> width, height
+        return [tuple(row) for row in (coords * zoom).astype(np.int64).tolist()]
+    return [(int(r.x0 * zoom), int(r.y0 * zoom),
+             int((r.x1 - r.x0) * zoom), int((r.y1 - r.y0) * zoom)) for r in rects]
+
+
+@lru_cache(maxsize=4)
+def _load_categories(path, mtime):
+    """Read category names from a business_categories.json file.
+    
+    mtime is only part of the cache key. Returns a sorted tuple of the file's
+    categories plus any Schedule C specific ones it lacks.
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    
+    # Extract category names (keys from the JSON)
+    categories = list(data.keys())
+    
+    # Add Schedule C specific categories that might not be in business categories
+    schedule_c_specific = [
+        'Car and truck expenses',
+        'Contract labor',
+        'Interest (other)',
+        'Legal and professional services',
+        'Office expenses',
+        'Travel',
+        'Other expenses',
+        'Total expenses'
+    ]
+    
+    # Combine business categories with Schedule C specific ones
+    existing = set(categories)
+    all_categories = categories + [cat for cat in schedule_c_specific if cat not in existing]
+    
+    print(f"✅ Loaded {len(categories)} business categories from {path}")
+    print(f"📋 Total categories available: {len(all_categories)}")
+    
+    return tuple(sorted(all_categories))
+
+
+class _RenderSignals(QObject):
+    """Signals for _RenderTask (QRunnable cannot emit signals itself)."""
+    
+    rendered = pyqtSignal(int, int, float, QImage)  # generation, page, zoom, image
+    failed = pyqtSignal(int, int, str)  # generation, page, error
+
+
+class _RenderTask(QRunnable):
+    """Rasterize one PDF page on a QThreadPool worker.
+    
+    The task opens its own fitz document: MuPDF documents must not be
+    shared between threads.
+    """
+    
+    def __init__(self, pdf_path, page_num, zoom, generation, signals):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.page_num = page_num
+        self.zoom = zoom
+        self.generation = generation
+        self.signals = signals
+        
+    def run(self):
+        import fitz  # PyMuPDF; imported on first use to keep GUI startup fast
+        try:
+            with fitz.open(self.pdf_path) as doc:
+                mat = fitz.Matrix(self.zoom, self.zoom)
+                # Forms are black on white; grayscale is a third of the RGB bytes
+                # and the red/blue field overlays are painted on top anyway
+                pix = doc[self.page_num].get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+                # copy() detaches the image from the MuPDF sample buffer
+                img = QImage(pix.samples, pix.width, pix.height, pix.stride,
+                             QImage.Format.Format_Grayscale8).copy()
+            self.signals.rendered.emit(self.generation, self.page_num, self.zoom, img)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, self.page_num, str(e))
+
+
 class PDFFieldMapperGUI(QMainWindow):
     """Main GUI class for PDF field mapping."""
     
+    ZOOM = 1.5  # Page render zoom for better visibility
+    PAGE_CACHE_SIZE = 8  # Rendered pages kept in memory
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PDF Field Mapper - Schedule C")
@@ -60,10 +236,24 @@ class PDFFieldMapperGUI(QMainWindow):
         self.pdf_doc = None
         self.current_page = 0
         self.form_fields = {}
+        self._fields_by_page = {}  # page number -> field info dicts on that page
         self.field_mappings = {}
+        self._mapping_items = {}  # category -> its row in mappings_tree
         self.selected_field = None
         self.pdf_pixmap = None
         
+        # Render cache: (page, zoom) -> page pixmap
+        self._page_cache = OrderedDict()
+        
+        # Background page rendering; results from a previously opened PDF
+        # are recognized by their generation and dropped
+        self.pdf_path = None
+        self._render_generation = 0
+        self._pending_renders = set()
+        self._render_signals = _RenderSignals(self)
+        self._render_signals.rendered.connect(self._on_page_rendered)
+        self._render_signals.failed.connect(self._on_render_failed)
+        
         # Load expense categories from business_categories.json
         self.expense_categories = self.load_business_categories()
         
@@ -90,31 +280,8 @@ class PDFFieldMapperGUI(QMainWindow):
         
         try:
             if os.path.exists(categories_file):
-                with open(categories_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Extract category names (keys from the JSON)
-                categories = list(data.keys())
-                
-                # Add Schedule C specific categories that might not be in business categories
-                schedule_c_specific = [
-                    'Car and truck expenses',
-                    'Contract labor',
-                    'Interest (other)',
-                    'Legal and professional services',
-                    'Office expenses',
-                    'Travel',
-                    'Other expenses',
-                    'Total expenses'
-                ]
-                
-                # Combine business categories with Schedule C specific ones
-                all_categories = categories + [cat for cat in schedule_c_specific if cat not in categories]
-                
-                print(f"✅ Loaded {len(categories)} business categories from {categories_file}")
-                print(f"📋 Total categories available: {len(all_categories)}")
-                
-                return sorted(all_categories)
+                # Cached per (path, mtime): an edited file is re-read
+                return _load_categories(categories_file, os.path.getmtime(categories_file))
                 
             else:
                 print(f"⚠️ {categories_file} not found, using default Schedule C categories")
@@ -248,11 +415,23 @@ class PDFFieldMapperGUI(QMainWindow):
             return
             
         try:
+            # No field clicks until the new document's overlays are shown
+            self.pdf_label.set_hit_testing_enabled(False)
+            import fitz  # PyMuPDF; imported on first use to keep GUI startup fast
             self.pdf_doc = fitz.open(file_path)
+            self.pdf_path = file_path
             self.current_page = 0
+            self._page_cache.clear()
+            self._render_generation += 1
+            self._pending_renders.clear()
             self.analyze_pdf_fields()
             self.display_page()
             
+            # Warm the cache with the rest of the form (Schedule C is only a
+            # few pages); stay within the cache so nothing is evicted unseen
+            for page_num in range(min(len(self.pdf_doc), self.PAGE_CACHE_SIZE)):
+                self._request_render(page_num)
+            
             # Enable navigation buttons
             self.prev_btn.setEnabled(len(self.pdf_doc) > 1)
             self.next_btn.setEnabled(len(self.pdf_doc) > 1)
@@ -265,50 +444,78 @@ class PDFFieldMapperGUI(QMainWindow):
     def analyze_pdf_fields(self):
         """Extract all form fields from the PDF."""
         self.form_fields = {}
+        self._fields_by_page = defaultdict(list)
         
+        text_widgets = []  # (page, field name, rect)
         for page_num in range(len(self.pdf_doc)):
             page = self.pdf_doc[page_num]
-            widgets = list(page.widgets())
             
-            for widget in widgets:
+            for widget in page.widgets():
                 if widget.field_type == 7:  # Text field (type 7, not 0)
-                    field_name = widget.field_name or f"unnamed_field_{len(self.form_fields)}"
-                    
-                    # Extract simple field name (like f1_36)
-                    simple_name = field_name.split('.')[-1].replace('[0]', '')
-                    
-                    self.form_fields[simple_name] = {
-                        'full_name': field_name,
-                        'page': page_num,
-                        'rect': widget.rect,
-                        'simple_name': simple_name
-                    }
-                    
+                    text_widgets.append((page_num, widget.field_name, widget.rect))
+        
+        # Scale to the rendered page once, not on every redraw
+        scaled = _scale_rects([rect for _page, _name, rect in text_widgets], self.ZOOM)
+        
+        form_fields = self.form_fields
+        for (page_num, field_name, rect), (x, y, width, height) in zip(text_widgets, scaled):
+            field_name = field_name or f"unnamed_field_{len(form_fields)}"
+            
+            # Extract simple field name (like f1_36); interned since it
+            # keys form_fields and every overlay/selection comparison
+            simple_name = field_name.rpartition('.')[2]
+            if simple_name.endswith('[0]'):
+                simple_name = simple_name[:-3]
+            simple_name = sys.intern(simple_name)
+            
+            form_fields[simple_name] = {
+                'full_name': field_name,
+                'page': page_num,
+                'rect': rect,
+                'simple_name': simple_name,
+                'qrect': QRect(x, y, width, height),
+                'label_pos': (x + 2, y + 12)
+            }
+        
+        # Group by page once (after the loop, so a name reused on a later
+        # page only appears where form_fields keeps it)
+        for field_info in self.form_fields.values():
+            self._fields_by_page[field_info['page']].append(field_info)
+    
+    def _cache_get(self, cache, key):
+        """Return a cached value and mark it most recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, cache, key, value):
+        """Store a value, evicting the least recently used beyond PAGE_CACHE_SIZE."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.PAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def display_page(self):
         """Display the current PDF page with field overlays."""
         if not self.pdf_doc:
             return
             
         try:
-            # Render PDF page
-            page = self.pdf_doc[self.current_page]
-            mat = fitz.Matrix(1.5, 1.5)  # 1.5x zoom for better visibility
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to QPixmap
-            img_data = pix.tobytes("ppm")
-            with tempfile.NamedTemporaryFile(suffix=".ppm", delete=False) as tmp_file:
-                tmp_file.write(img_data)
-                tmp_file.flush()
-                
-                self.pdf_pixmap = QPixmap(tmp_file.name)
-                os.unlink(tmp_file.name)
-            
-            # Add field overlays
-            self.add_field_overlays()
+            self.pdf_pixmap = self._cache_get(self._page_cache, (self.current_page, self.ZOOM))
+            if self.pdf_pixmap is None:
+                # Render in the background; _on_page_rendered shows it
+                self.pdf_label.set_field_overlays([])
+                self.pdf_label.setText(f"Rendering page {self.current_page + 1}...")
+                self._request_render(self.current_page)
+            else:
+                # Add field overlays and display in label
+                self.add_field_overlays()
             
-            # Display in label
-            self.pdf_label.setPixmap(self.pdf_pixmap)
+            # Prefetch the neighbouring pages
+            for page_num in (self.current_page + 1, self.current_page - 1):
+                if 0 <= page_num < len(self.pdf_doc):
+                    self._request_render(page_num)
             
             # Update page label
             self.page_label.setText(f"Page {self.current_page + 1} of {len(self.pdf_doc)}")
@@ -316,56 +523,49 @@ class PDFFieldMapperGUI(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to display page: {e}")
             
-    def add_field_overlays(self):
-        """Add visual overlays for form fields on current page."""
-        if not self.pdf_pixmap:
+    def _request_render(self, page_num):
+        """Queue a background render of page_num unless cached or queued."""
+        key = (page_num, self.ZOOM)
+        if key in self._page_cache or key in self._pending_renders:
             return
-            
-        # Create a copy of the pixmap to draw on
-        overlay_pixmap = self.pdf_pixmap.copy()
-        painter = QPainter()
+        self._pending_renders.add(key)
+        QThreadPool.globalInstance().start(
+            _RenderTask(self.pdf_path, page_num, self.ZOOM, self._render_generation, self._render_signals)
+        )
         
-        if not painter.begin(overlay_pixmap):
-            print("Failed to begin painting")
+    def _on_page_rendered(self, generation, page_num, zoom, img):
+        """Cache a page rendered in the background and show it if current."""
+        if generation != self._render_generation:
             return
+        key = (page_num, zoom)
+        self._pending_renders.discard(key)
+        pixmap = QPixmap.fromImage(img)
+        self._cache_put(self._page_cache, key, pixmap)
+        if page_num == self.current_page and zoom == self.ZOOM:
+            self.pdf_pixmap = pixmap
+            self.add_field_overlays()
             
-        try:
-            # Setup drawing
-            pen = QPen(QColor(255, 0, 0), 2)  # Red pen
-            painter.setPen(pen)
-            painter.setFont(QFont("Arial", 8))
-            
-            # Field overlays for click detection
-            field_overlays = []
-            
-            # Get fields for current page
-            current_page_fields = [f for f in self.form_fields.values() if f['page'] == self.current_page]
+    def _on_render_failed(self, generation, page_num, error):
+        """Report a background render error for the current document."""
+        if generation != self._render_generation:
+            return
+        self._pending_renders.discard((page_num, self.ZOOM))
+        QMessageBox.critical(self, "Error", f"Failed to display page: {error}")
             
-            for field_info in current_page_fields:
-                rect = field_info['rect']
-                simple_name = field_info['simple_name']
-                
-                # Scale coordinates (1.5x zoom)
-                x1, y1, x2, y2 = rect.x0 * 1.5, rect.y0 * 1.5, rect.x1 * 1.5, rect.y1 * 1.5
-                
-                # Draw rectangle overlay
-                painter.drawRect(int(x1), int(y1), int(x2-x1), int(y2-y1))
-                
-                # Draw field name
-                painter.setPen(QPen(QColor(255, 0, 0), 1))
-                painter.drawText(int(x1 + 2), int(y1 + 12), simple_name)
-                painter.setPen(pen)
-                
-                # Store for click detection
-                click_rect = QRect(int(x1), int(y1), int(x2-x1), int(y2-y1))
-                field_overlays.append((simple_name, click_rect))
-                
-        finally:
-            painter.end()
+    def add_field_overlays(self):
+        """Add visual overlays for form fields on current page."""
+        if not self.pdf_pixmap:
+            return
+        
+        # Get fields for current page
+        current_page_fields = self._fields_by_page.get(self.current_page, ())
         
-        # Set the overlay data and pixmap
-        self.pdf_label.set_field_overlays(field_overlays)
-        self.pdf_label.setPixmap(overlay_pixmap)
+        # The label paints these over the unmodified page pixmap
+        self.pdf_label.setPixmap(self.pdf_pixmap)
+        self.pdf_label.set_field_overlays(
+            [(f['simple_name'], f['qrect'], f['label_pos']) for f in current_page_fields]
+        )
+        self.pdf_label.set_hit_testing_enabled(bool(current_page_fields))
         
     def field_clicked(self, x, y, field_name):
         """Handle field click events."""
@@ -383,49 +583,7 @@ class PDFFieldMapperGUI(QMainWindow):
         
     def highlight_selected_field(self, selected_field):
         """Highlight the selected field."""
-        if not self.pdf_pixmap:
-            return
-            
-        # Create a copy of the original pixmap
-        overlay_pixmap = self.pdf_pixmap.copy()
-        painter = QPainter()
-        
-        if not painter.begin(overlay_pixmap):
-            print("Failed to begin painting for highlight")
-            return
-            
-        try:
-            # Get fields for current page
-            current_page_fields = [f for f in self.form_fields.values() if f['page'] == self.current_page]
-            
-            for field_info in current_page_fields:
-                rect = field_info['rect']
-                simple_name = field_info['simple_name']
-                
-                # Scale coordinates (1.5x zoom)
-                x1, y1, x2, y2 = rect.x0 * 1.5, rect.y0 * 1.5, rect.x1 * 1.5, rect.y1 * 1.5
-                
-                # Choose color based on selection
-                if simple_name == selected_field:
-                    pen = QPen(QColor(0, 0, 255), 3)  # Blue for selected
-                    painter.setBrush(QColor(0, 0, 255, 50))  # Light blue fill
-                else:
-                    pen = QPen(QColor(255, 0, 0), 2)  # Red for unselected
-                    painter.setBrush(QColor(255, 255, 0, 50))  # Light yellow fill
-                    
-                painter.setPen(pen)
-                
-                # Draw rectangle
-                painter.drawRect(int(x1), int(y1), int(x2-x1), int(y2-y1))
-                
-                # Draw field name
-                painter.setPen(QPen(QColor(255, 0, 0), 1))
-                painter.drawText(int(x1 + 2), int(y1 + 12), simple_name)
-                
-        finally:
-            painter.end()
-            
-        self.pdf_label.setPixmap(overlay_pixmap)
+        self.pdf_label.set_selected_field(selected_field)
         
     def map_field(self):
         """Map the selected field to the selected category."""
@@ -438,19 +596,17 @@ class PDFFieldMapperGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a category")
             return
             
-        # Remove existing mapping for this category
-        for i in range(self.mappings_tree.topLevelItemCount()):
-            item = self.mappings_tree.topLevelItem(i)
-            if item.text(0) == category:
-                self.mappings_tree.takeTopLevelItem(i)
-                break
-                
         # Add new mapping
         self.field_mappings[category] = self.selected_field
         
-        # Add to tree widget
-        item = QTreeWidgetItem([category, self.selected_field])
-        self.mappings_tree.addTopLevelItem(item)
+        # Update the category's existing row, or add one
+        item = self._mapping_items.get(category)
+        if item is not None:
+            item.setText(1, self.selected_field)
+        else:
+            item = QTreeWidgetItem([category, self.selected_field])
+            self.mappings_tree.addTopLevelItem(item)
+            self._mapping_items[category] = item
         
         self.statusBar().showMessage(f"Mapped {category} → {self.selected_field}")
         
@@ -464,6 +620,7 @@ class PDFFieldMapperGUI(QMainWindow):
         category = current_item.text(0)
         if category in self.field_mappings:
             del self.field_mappings[category]
+        self._mapping_items.pop(category, None)
             
         self.mappings_tree.takeTopLevelItem(self.mappings_tree.indexOfTopLevelItem(current_item))
         self.statusBar().showMessage("Mapping cleared")
@@ -536,16 +693,17 @@ class PDFFieldMapperGUI(QMainWindow):
             # Clear existing mappings
             self.mappings_tree.clear()
             self.field_mappings = {}
+            self._mapping_items = {}
             
             # Load mappings
             mappings = data.get("schedule_c_mappings", {})
             for category, info in mappings.items():
                 field_pattern = info.get("field_pattern", "")
                 self.field_mappings[category] = field_pattern
+                self._mapping_items[category] = QTreeWidgetItem([category, field_pattern])
                 
-                # Add to tree widget
-                item = QTreeWidgetItem([category, field_pattern])
-                self.mappings_tree.addTopLevelItem(item)
+            # Add to tree widget in one insert
+            self.mappings_tree.addTopLevelItems(list(self._mapping_items.values()))
                 
             QMessageBox.information(self, "Success", f"Loaded {len(mappings)} mappings")
             self.statusBar().showMessage(f"Loaded mapping with {len(mappings)} entries")
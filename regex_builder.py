@@ -5,7 +5,7 @@ Scan a bank statement PDF and learn a structure-based selector for transaction r
 No merchant/amount literals are used. Instead, we infer patterns from repeated layout.
 
 Requirements:
-  pip install pdfplumber numpy scikit-learn regex pandas
+  pip install pdfplumber numpy scikit-learn regex
   pip install Pillow  # for --draw flag
 
 Optional (for image-only PDFs):
@@ -14,13 +14,15 @@ Optional (for image-only PDFs):
 Usage:
   python transaction_finder.py path/to/statement.pdf [--draw]
 """
-import sys, re, math, json, argparse
-from dataclasses import dataclass
+import sys, os, io, re, math, json, argparse, csv, contextlib, operator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from collections import Counter
+from itertools import repeat
 from typing import List, Tuple, Dict, Any, Optional
 import pdfplumber
 import numpy as np
-from sklearn.cluster import KMeans
-import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
 
 # Drawing imports (optional)
 try:
@@ -31,7 +33,15 @@ except ImportError:
     print("PIL not available. Install with: pip install Pillow")
 
 # ---- Generic shapes (no literals) ----
-RE_MONEY = re.compile(r"[+\-]?\d{1,3}(?:,\d{3})*\.\d{2}")  # 1,234.56  -12.00  8.90
+# Compiled with re.ASCII: \d and case folding stay ASCII-only, which is all
+# statement digits/month names need and keeps the matcher on its fast path.
+RE_MONEY = re.compile(r"[+\-]?\d{1,3}(?:,\d{3})*\.\d{2}", re.ASCII)  # 1,234.56  -12.00  8.90
+# Whole-token money check; an amount always starts with a sign or a digit,
+# which lets callers skip the regex for ordinary words
+RE_MONEY_FULL = re.compile(rf"(?:{RE_MONEY.pattern})\Z", re.ASCII)
+MONEY_FIRST_CHARS = frozenset("+-0123456789")
+# RE_DATE stays Unicode-aware: its \s must still match a non-breaking space
+# between the day, month and year of extracted text
 RE_DATE = re.compile(
     r"""(?ix)
     (?:\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?)     # 01/31[/2025]
@@ -41,7 +51,40 @@ RE_DATE = re.compile(
     """
 )
 
-@dataclass
+# Keywords marking summary/header content rather than transactions, as one
+# case-insensitive alternation (a single C scan per line)
+NON_TRANSACTION_KEYWORDS = [
+    'balance', 'payment due', 'credit limit', 'customer service',
+    'website', 'phone', 'autopay', 'account message', 'previous balance',
+    'new balance', 'minimum payment', 'past due', 'fees charged',
+    'cash advance', 'balance transfer', 'www.', '.com', 'http'
+]
+RE_NON_TRANSACTION = re.compile("|".join(map(re.escape, NON_TRANSACTION_KEYWORDS)), re.IGNORECASE | re.ASCII)
+
+# Stricter list for the final row filter in main()
+SUMMARY_ROW_KEYWORDS = [
+    'previous balance', 'new balance', 'minimum payment', 'payment due',
+    'credit limit', 'past due', 'fees charged', 'cash advance',
+    'balance transfer', 'messages for details', 'over the credit limit'
+]
+RE_SUMMARY_ROW = re.compile("|".join(map(re.escape, SUMMARY_ROW_KEYWORDS)), re.IGNORECASE | re.ASCII)
+
+# Building blocks for the learned row templates (see derive_regex_template).
+# Enhanced date pattern to handle multiple formats:
+# - MM/DD/YY or MM/DD/YYYY (Visa format)
+# - Mon DD (Capital One format like "Jan 21")
+# - DD Mon YYYY (like "21 Jan 2024")
+TEMPLATE_DATE = r"(?:(?:\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?)|(?:\d{4}[/-]\d{1,2}[/-]\d{1,2})|(?:\d{1,2}\s+[A-Za-z]{3,9}\s+\d{2,4})|(?:[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{2,4})|(?:[A-Za-z]{3,9}\s+\d{1,2}))"
+TEMPLATE_MONEY = RE_MONEY.pattern
+# Money with an optional $ prefix
+TEMPLATE_MONEY_WITH_DOLLAR = rf"\${TEMPLATE_MONEY}|{TEMPLATE_MONEY}"
+
+@lru_cache(maxsize=256)
+def _rx(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    """Compile each distinct template once (pages of a statement share templates)."""
+    return re.compile(pattern, flags)
+
+@dataclass(slots=True)
 class Token:
     text: str
     x0: float
@@ -50,134 +93,183 @@ class Token:
     y1: float
     size: float
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     tokens: List[Token]
     y: float  # baseline / middle
     text: str
+    # Shape classifications, computed once from text (see __post_init__)
+    n_date: int = field(init=False)
+    n_money: int = field(init=False)
+    has_date: bool = field(init=False)
+    has_money: bool = field(init=False)
+    is_summary: bool = field(init=False)
+
+    def __post_init__(self):
+        self.n_date = len(RE_DATE.findall(self.text))
+        self.n_money = len(RE_MONEY.findall(self.text))
+        self.has_date = self.n_date > 0
+        self.has_money = self.n_money > 0
+        self.is_summary = RE_NON_TRANSACTION.search(self.text) is not None
+
+_CHAR_FIELDS = operator.itemgetter("x0", "x1", "top", "bottom", "size", "text")
 
 def load_page_lines(page) -> List[Line]:
     """
     Reconstruct lines from page.chars, grouping by similar y and merging chars into words/tokens.
+    Char geometry is held in flat NumPy arrays; token boundaries and bounds
+    are found for the whole page at once.
     """
     chars = page.chars
     if not chars:
         return []
 
+    # Read each char dict once, into parallel columns
+    x0, x1, top, bottom, size, text = zip(*map(_CHAR_FIELDS, chars))
+
     # Convert chars -> tokens (rough word grouping on small x-gaps)
     # First, sort by y (top) then x (left)
-    chars_sorted = sorted(chars, key=lambda c: (round(c["top"], 1), c["x0"]))
-    lines: List[List[dict]] = []
-    current: List[dict] = []
-    last_top = None
+    # (lexsort is stable and sorts by the last key first; the tops are rounded
+    # with Python's round() so ties break exactly as the old sorted() key did)
+    n_chars = len(text)
+    x0, x1, top, bottom, size = (np.array(col, dtype=float) for col in (x0, x1, top, bottom, size))
+    top_rounded = np.fromiter(map(round, top.tolist(), repeat(1, n_chars)), dtype=float, count=n_chars)
+    order = np.lexsort((x0, top_rounded))
+    x0, x1, top, bottom, size = (col[order] for col in (x0, x1, top, bottom, size))
+    text = [text[i] for i in order.tolist()]
+
+    # Group into lines against a running-average baseline (inherently sequential)
     y_tol = 2.0  # tolerance for being on the same baseline (points)
-
-    for c in chars_sorted:
-        if last_top is None or abs(c["top"] - last_top) <= y_tol:
-            current.append(c)
-            last_top = c["top"] if last_top is None else (last_top + c["top"]) / 2
+    new_line = np.zeros(len(text), dtype=bool)
+    last_top = float(top[0])
+    for i, t in enumerate(top.tolist()):
+        if abs(t - last_top) <= y_tol:
+            last_top = (last_top + t) / 2
         else:
-            lines.append(current)
-            current = [c]
-            last_top = c["top"]
-    if current:
-        lines.append(current)
-
-    # Merge chars into tokens by small x-gaps
-    def to_tokens(raw_line: List[dict]) -> List[Token]:
-        raw_line = sorted(raw_line, key=lambda c: c["x0"])
-        tokens: List[Token] = []
-        buf = [raw_line[0]]
-        for a, b in zip(raw_line, raw_line[1:]):
-            gap = b["x0"] - a["x1"]
-            # dynamic threshold: small gap relative to font size
-            thr = max(1.5, 0.3 * a["size"])
-            if gap <= thr:
-                buf.append(b)
-            else:
-                txt = "".join(ch["text"] for ch in buf)
-                t = Token(
-                    text=txt,
-                    x0=min(ch["x0"] for ch in buf),
-                    x1=max(ch["x1"] for ch in buf),
-                    y0=min(ch["top"] for ch in buf),
-                    y1=max(ch["bottom"] for ch in buf),
-                    size=sum(ch["size"] for ch in buf)/len(buf),
-                )
-                tokens.append(t)
-                buf = [b]
-        if buf:
-            txt = "".join(ch["text"] for ch in buf)
-            t = Token(
-                text=txt,
-                x0=min(ch["x0"] for ch in buf),
-                x1=max(ch["x1"] for ch in buf),
-                y0=min(ch["top"] for ch in buf),
-                y1=max(ch["bottom"] for ch in buf),
-                size=sum(ch["size"] for ch in buf)/len(buf),
-            )
-            tokens.append(t)
-        return tokens
+            new_line[i] = True
+            last_top = t
+    line_id = np.cumsum(new_line)
+
+    # Left-to-right within each line (lexsort is stable, like sorted())
+    order = np.lexsort((x0, line_id))
+    x0, x1, top, bottom, size, line_id = (a[order] for a in (x0, x1, top, bottom, size, line_id))
+    text = [text[i] for i in order.tolist()]
+
+    # Merge chars into tokens by small x-gaps:
+    # dynamic threshold, small gap relative to font size; new lines always break
+    gap = x0[1:] - x1[:-1]
+    thr = np.maximum(1.5, 0.3 * size[:-1])
+    breaks = (gap > thr) | (line_id[1:] != line_id[:-1])
+    starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    ends = np.append(starts[1:], len(text))
+
+    tok_x0 = np.minimum.reduceat(x0, starts).tolist()
+    tok_x1 = np.maximum.reduceat(x1, starts).tolist()
+    tok_y0 = np.minimum.reduceat(top, starts).tolist()
+    tok_y1 = np.maximum.reduceat(bottom, starts).tolist()
+    tok_size = (np.add.reduceat(size, starts) / (ends - starts)).tolist()
+    tok_line = line_id[starts].tolist()
+
+    line_tokens: Dict[int, List[Token]] = {}
+    for k, (s, e) in enumerate(zip(starts.tolist(), ends.tolist())):
+        txt = "".join(text[s:e])
+        if not txt.strip():
+            continue
+        line_tokens.setdefault(tok_line[k], []).append(
+            Token(text=txt, x0=tok_x0[k], x1=tok_x1[k], y0=tok_y0[k], y1=tok_y1[k], size=tok_size[k])
+        )
 
     out: List[Line] = []
-    for raw in lines:
-        toks = [t for t in to_tokens(raw) if t.text.strip()]
-        if not toks:
-            continue
+    for toks in line_tokens.values():
         y_mid = np.median([(t.y0 + t.y1) / 2 for t in toks])
         text = " ".join(t.text for t in toks)
         out.append(Line(tokens=toks, y=y_mid, text=text))
     return out
 
-def line_features(L: Line, page_width: float) -> Dict[str, Any]:
-    txt = L.text
-    total = sum(len(t.text) for t in L.tokens)
-    n_alpha = sum(sum(ch.isalpha() for ch in t.text) for t in L.tokens)
-    n_digit = sum(sum(ch.isdigit() for ch in t.text) for t in L.tokens)
-    n_punct = sum(sum((not ch.isalnum() and not ch.isspace()) for ch in t.text) for t in L.tokens)
-    alpha_ratio = (n_alpha / total) if total else 0.0
+# Column order of the line feature matrix (and keys of the per-line feature dicts)
+FEATURE_NAMES = (
+    "len_tokens", "alpha_ratio", "n_digit", "n_punct", "has_money", "n_money",
+    "has_date", "x_span", "rightmost_is_money", "size_mean", "size_std",
+)
+
+def _build_char_classes() -> np.ndarray:
+    """(256, 3) table of isalpha / isdigit / punctuation for Latin-1 code points."""
+    table = np.zeros((256, 3), dtype=np.int64)
+    for code in range(256):
+        ch = chr(code)
+        table[code] = (ch.isalpha(), ch.isdigit(), not ch.isalnum() and not ch.isspace())
+    return table
+
+_CHAR_CLASSES = _build_char_classes()
+
+def _is_money_token(text: str) -> bool:
+    """True if the (stripped) token is exactly one amount, like RE_MONEY.fullmatch."""
+    tok = text.strip()
+    return tok[:1] in MONEY_FIRST_CHARS and RE_MONEY_FULL.match(tok) is not None
+
+def line_feature_matrix(lines: List[Line], page_width: float) -> np.ndarray:
+    """
+    Build the (N, 11) feature matrix for all lines of a page in one pass.
+    Character classes and token geometry are computed over flat arrays
+    (one entry per char / per token) and reduced per line.
+    """
+    n_lines = len(lines)
+    if n_lines == 0:
+        return np.zeros((0, len(FEATURE_NAMES)), dtype=float)
+
+    # Character counts: one code point array for the whole page
+    texts = ["".join(t.text for t in L.tokens) for L in lines]
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+    classes = _CHAR_CLASSES[np.minimum(codes, 255)]
+    for i in np.flatnonzero(codes > 255):  # rare non-Latin-1 chars
+        ch = chr(int(codes[i]))
+        classes[i] = (ch.isalpha(), ch.isdigit(), not ch.isalnum() and not ch.isspace())
+    char_ends = np.cumsum([len(t) for t in texts])
+    cum = np.vstack([np.zeros((1, 3), dtype=np.int64), np.cumsum(classes, axis=0)])
+    counts = cum[char_ends] - cum[np.concatenate(([0], char_ends[:-1]))]
+    total = char_ends - np.concatenate(([0], char_ends[:-1]))
+    alpha_ratio = np.divide(counts[:, 0], total, out=np.zeros(n_lines), where=total > 0)
+
+    # Token geometry: one entry per token, reduced per line
+    n_tokens = np.array([len(L.tokens) for L in lines])
+    starts = np.concatenate(([0], np.cumsum(n_tokens)[:-1]))
+    n_total = int(n_tokens.sum())
+    centers = np.fromiter(((t.x0 + t.x1)/2 for L in lines for t in L.tokens), dtype=float, count=n_total)
+    sizes = np.fromiter((t.size for L in lines for t in L.tokens), dtype=float, count=n_total)
+    x_range = np.maximum.reduceat(centers, starts) - np.minimum.reduceat(centers, starts)
+    size_mean = np.add.reduceat(sizes, starts) / n_tokens
+    size_dev = sizes - np.repeat(size_mean, n_tokens)
+    size_std = np.sqrt(np.add.reduceat(size_dev * size_dev, starts) / n_tokens)
 
     # shapes (no literals)
-    has_money = bool(RE_MONEY.search(txt))
-    n_money = len(RE_MONEY.findall(txt))
-    has_date = bool(RE_DATE.search(txt))
-
-    # columns: approximate by x-centers
-    xs = np.array([(t.x0 + t.x1)/2 for t in L.tokens])
-    x_min, x_max = xs.min(), xs.max()
-    x_range = x_max - x_min
-    rightmost_token = max(L.tokens, key=lambda t: t.x1)
-    rightmost_is_money = bool(RE_MONEY.fullmatch(rightmost_token.text.strip()))
-
-    sizes = [t.size for t in L.tokens]
-    size_mean = float(np.mean(sizes))
-    size_std = float(np.std(sizes))
-
-    return dict(
-        len_tokens=len(L.tokens),
-        alpha_ratio=alpha_ratio,
-        n_digit=n_digit,
-        n_punct=n_punct,
-        has_money=int(has_money),
-        n_money=n_money,
-        has_date=int(has_date),
-        x_span=x_range / max(1.0, page_width),  # normalized
-        rightmost_is_money=int(rightmost_is_money),
-        size_mean=size_mean,
-        size_std=size_std,
-    )
+    n_money = np.array([L.n_money for L in lines])
+    has_date = np.array([L.has_date for L in lines])
+    rightmost_is_money = np.array([_is_money_token(max(L.tokens, key=lambda t: t.x1).text) for L in lines])
+
+    return np.column_stack([
+        n_tokens,
+        alpha_ratio,
+        counts[:, 1],
+        counts[:, 2],
+        n_money > 0,
+        n_money,
+        has_date,
+        x_range / max(1.0, page_width),  # normalized
+        rightmost_is_money,
+        size_mean,
+        size_std,
+    ]).astype(float)
 
 def cluster_transactions(lines: List[Line], page_width: float) -> Tuple[List[int], List[Dict[str, Any]]]:
     # Feature matrix
-    feats = [line_features(L, page_width) for L in lines]
-    X = np.array([[f["len_tokens"], f["alpha_ratio"], f["n_digit"], f["n_punct"],
-                   f["has_money"], f["n_money"], f["has_date"], f["x_span"],
-                   f["rightmost_is_money"], f["size_mean"], f["size_std"]] for f in feats], dtype=float)
+    X = line_feature_matrix(lines, page_width)
+    feats = [dict(zip(FEATURE_NAMES, row)) for row in X.tolist()]
 
-    # Try k=2..4; pick the k/labels whose "transaction score" is best
+    # Try k=2..4 (k=2 only on short pages); pick the k/labels whose
+    # "transaction score" is best
     # But ensure we don't try more clusters than we have samples
     n_samples = X.shape[0]
-    max_k = min(4, n_samples)
+    max_k = min(4, n_samples) if n_samples >= 30 else 2
     
     # Handle edge case where we have very few samples
     if n_samples < 2:
@@ -185,10 +277,21 @@ def cluster_transactions(lines: List[Line], page_width: float) -> Tuple[List[int
         labels = np.zeros(n_samples, dtype=int)
         return labels, feats
     
+    # Fast path: enough date+money rows ending in one right-aligned column
+    # already identify the transactions, so skip KMeans for them
+    structural = np.array([L.has_date and L.has_money and not L.is_summary for L in lines])
+    if structural.sum() >= 15:
+        right_edges = [L.tokens[-1].x1 for L, keep in zip(lines, structural) if keep]
+        if np.std(right_edges) < 0.02 * page_width:
+            return structural.astype(int), feats
+    
+    # Standardize once so no single feature (e.g. font size) dominates the distances
+    Xs = (X - X.mean(axis=0)) / (X.std(axis=0) + 1e-9)
+    
     best = None
     for k in range(2, max_k + 1):
-        km = KMeans(n_clusters=k, n_init=8, random_state=42)
-        labels = km.fit_predict(X)
+        km = MiniBatchKMeans(n_clusters=k, n_init=3, batch_size=min(256, n_samples), random_state=42)
+        labels = km.fit_predict(Xs)
         score, best_label = evaluate_clusters(labels, feats, lines)
         if (best is None) or (score > best[0]):
             best = (score, labels, best_label)
@@ -206,43 +309,35 @@ def evaluate_clusters(labels: np.ndarray, feats: List[Dict[str, Any]], lines: Li
     Score each cluster and return the best one for transactions.
     Enhanced to filter out summary/header content.
     """
+    labels = np.asarray(labels)
+    # Columns: has_money, rightmost_is_money, alpha_ratio, size_std
+    F_arr = np.array([[f["has_money"], f["rightmost_is_money"], f["alpha_ratio"], f["size_std"]]
+                      for f in feats], dtype=float).reshape(-1, 4)
+    # Columns: multiple dates (transaction + posting date), transaction-like
+    # (date + money + reasonable length + not summary), summary-like
+    L_arr = np.array([[L.n_date >= 2,
+                       L.has_date and L.has_money and len(L.text.strip()) > 10 and not L.is_summary,
+                       L.is_summary]
+                      for L in lines], dtype=float).reshape(-1, 3)
+    
     score_best, label_best = -1e9, -1
     for lab in set(labels):
-        idxs = [i for i, L in enumerate(labels) if L == lab]
-        F = [feats[i] for i in idxs]
-        n = len(F)
+        mask = labels == lab
+        sub = F_arr[mask]
+        line_sub = L_arr[mask]
+        n = len(sub)
         
         # Basic metrics
-        money_rate = np.mean([f["has_money"] for f in F])
-        right_money_rate = np.mean([f["rightmost_is_money"] for f in F])
-        alpha_med = np.median([f["alpha_ratio"] for f in F])
-        size_std_med = np.median([f["size_std"] for f in F])
+        money_rate = sub[:, 0].mean()
+        right_money_rate = sub[:, 1].mean()
+        alpha_med = np.median(sub[:, 2])
+        size_std_med = np.median(sub[:, 3])
         
         # Check for multiple date patterns in cluster lines
-        cluster_lines = [lines[i] for i in idxs]
-        multi_date_rate = np.mean([len(RE_DATE.findall(L.text)) >= 2 for L in cluster_lines])
+        multi_date_rate = line_sub[:, 0].mean()
         
-        # Filter out obvious non-transaction content
-        non_transaction_keywords = [
-            'balance', 'payment due', 'credit limit', 'customer service',
-            'website', 'phone', 'autopay', 'account message', 'previous balance',
-            'new balance', 'minimum payment', 'past due', 'fees charged',
-            'cash advance', 'balance transfer', 'www.', '.com', 'http'
-        ]
-        
-        # Count lines that look like actual transactions (have dates AND reasonable descriptions)
-        transaction_like = 0
-        for line in cluster_lines:
-            text_lower = line.text.lower()
-            has_date = bool(RE_DATE.search(line.text))
-            has_money = bool(RE_MONEY.search(line.text))
-            is_summary = any(keyword in text_lower for keyword in non_transaction_keywords)
-            
-            # Good transaction indicators: date + money + reasonable length + not summary
-            if has_date and has_money and len(line.text.strip()) > 10 and not is_summary:
-                transaction_like += 1
-        
-        transaction_rate = transaction_like / n if n > 0 else 0
+        # Share of lines that look like actual transactions (have dates AND reasonable descriptions)
+        transaction_rate = line_sub[:, 1].mean() if n > 0 else 0
         
         # Score: prioritize clusters with money, consistent formatting, and transaction-like content
         score = (
@@ -263,7 +358,7 @@ def evaluate_clusters(labels: np.ndarray, feats: List[Dict[str, Any]], lines: Li
             score += 200.0
             
         # Penalty for clusters with too many summary-like lines
-        summary_rate = np.mean([any(keyword in line.text.lower() for keyword in non_transaction_keywords) for line in cluster_lines])
+        summary_rate = line_sub[:, 2].mean()
         if summary_rate > 0.5:
             score -= 150.0
         
@@ -272,35 +367,19 @@ def evaluate_clusters(labels: np.ndarray, feats: List[Dict[str, Any]], lines: Li
     
     return score_best, label_best
 
-def derive_regex_template(lines: List[Line]) -> str:
+def derive_regex_template(lines: List[Line]) -> "re.Pattern[str]":
     """
     Build a generic regex for the cluster: DATE?  DESC  AMOUNT  [BALANCE]?
     Enhanced for Chase statement format with better filtering.
+    Returns the compiled pattern.
     """
-    # Enhanced date pattern to handle multiple formats:
-    # - MM/DD/YY or MM/DD/YYYY (Visa format)
-    # - Mon DD (Capital One format like "Jan 21")
-    # - DD Mon YYYY (like "21 Jan 2024")
-    date = r"(?:(?:\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?)|(?:\d{4}[/-]\d{1,2}[/-]\d{1,2})|(?:\d{1,2}\s+[A-Za-z]{3,9}\s+\d{2,4})|(?:[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{2,4})|(?:[A-Za-z]{3,9}\s+\d{1,2}))"
-    money = r"[+\-]?\d{1,3}(?:,\d{3})*\.\d{2}"
+    date = TEMPLATE_DATE
 
     # Filter lines to only those that look like actual transactions
     filtered_lines = []
-    non_transaction_keywords = [
-        'balance', 'payment due', 'credit limit', 'customer service',
-        'website', 'phone', 'autopay', 'account message', 'previous balance',
-        'new balance', 'minimum payment', 'past due', 'fees charged',
-        'cash advance', 'balance transfer', 'www.', '.com', 'http'
-    ]
-    
     for line in lines:
-        text_lower = line.text.lower()
-        has_date = bool(RE_DATE.search(line.text))
-        has_money = bool(RE_MONEY.search(line.text))
-        is_summary = any(keyword in text_lower for keyword in non_transaction_keywords)
-        
         # Only include lines that look like transactions
-        if has_date and has_money and len(line.text.strip()) > 10 and not is_summary:
+        if line.has_date and line.has_money and len(line.text.strip()) > 10 and not line.is_summary:
             filtered_lines.append(line)
     
     # Fall back to original lines if filtering removes everything
@@ -308,8 +387,8 @@ def derive_regex_template(lines: List[Line]) -> str:
         filtered_lines = lines
     
     # Check if lines have multiple dates (common in transaction logs)
-    has_date_rate = np.mean([bool(RE_DATE.search(L.text)) for L in filtered_lines])
-    multiple_dates = np.mean([len(RE_DATE.findall(L.text)) >= 2 for L in filtered_lines])
+    has_date_rate = np.mean([L.has_date for L in filtered_lines])
+    multiple_dates = np.mean([L.n_date >= 2 for L in filtered_lines])
     
     # Build date part - handle single or multiple dates
     if multiple_dates > 0.5:
@@ -320,11 +399,10 @@ def derive_regex_template(lines: List[Line]) -> str:
         date_part = rf"{date}\s+" if has_date_rate > 0.6 else rf"(?:{date}\s+)?"
 
     # If most lines have two money-like tokens (amount + balance), allow two:
-    n_money_counts = [len(RE_MONEY.findall(L.text)) for L in filtered_lines]
+    n_money_counts = [L.n_money for L in filtered_lines]
     two_money_rate = np.mean([c >= 2 for c in n_money_counts]) if n_money_counts else 0
 
-    # Adjust money pattern to handle $ prefix
-    money_with_dollar = rf"\${money}|{money}"
+    money_with_dollar = TEMPLATE_MONEY_WITH_DOLLAR
 
     if two_money_rate >= 0.5:
         # Desc is anything between date and first money; then a money; then space and another money
@@ -332,7 +410,32 @@ def derive_regex_template(lines: List[Line]) -> str:
     else:
         pattern = rf"^\s*{date_part}(.+?)\s+({money_with_dollar})\s*$"
 
-    return pattern
+    return _rx(pattern)
+
+def match_lines(R: "re.Pattern[str]", lines: List[Line]) -> List[Optional["re.Match[str]"]]:
+    """
+    Apply a learned template to every line, like R.match(L.text) per line.
+    One MULTILINE finditer pass over the newline-joined texts does the work;
+    a match is only taken if it starts and ends inside its own line (\\s in
+    the template can otherwise run across the newline), and lines without
+    one are retried on their own.
+    """
+    texts = [L.text for L in lines]
+    line_at = {}  # start offset in the joined buffer -> (line index, end offset)
+    offset = 0
+    for i, text in enumerate(texts):
+        line_at[offset] = (i, offset + len(text))
+        offset += len(text) + 1
+
+    matches: List[Optional["re.Match[str]"]] = [None] * len(texts)
+    for m in _rx(R.pattern, re.MULTILINE).finditer("\n".join(texts)):
+        hit = line_at.get(m.start())
+        if hit is not None and m.end() <= hit[1]:
+            matches[hit[0]] = m
+    for i, text in enumerate(texts):
+        if matches[i] is None:
+            matches[i] = R.match(text)
+    return matches
 
 def draw_page_analysis(page, lines: List[Line], labels: List[int], chosen_cluster: int, page_num: int, output_dir: str = "."):
     """Draw a visual analysis of the page with detected transaction lines and guides."""
@@ -453,115 +556,168 @@ def draw_page_analysis(page, lines: List[Line], labels: List[int], chosen_cluste
     img.save(output_path)
     print(f"Saved page analysis: {output_path}")
 
-def main(pdf_path: str, draw_analysis: bool = False):
-    rows: List[Dict[str, Any]] = []
-    with pdfplumber.open(pdf_path) as pdf:
-        print(f"Processing PDF with {len(pdf.pages)} pages...")
-        for pno, page in enumerate(pdf.pages, 1):
-            print(f"\n--- Page {pno} ---")
-            W = float(page.width)
-            lines = load_page_lines(page)
-            print(f"Extracted {len(lines)} lines from page {pno}")
-            
-            if not lines:
-                print("No lines found on this page, skipping...")
-                continue
-                
-            # Show first few lines for debugging
-            print("Sample lines:")
-            for i, line in enumerate(lines[:5]):
-                print(f"  {i+1}: {line.text[:80]}...")
-            
-            labels, feats = cluster_transactions(lines, W)
-            print(f"Clustering produced {len(set(labels))} clusters with labels: {set(labels)}")
-            
-            # pick chosen cluster
-            score, chosen = evaluate_clusters(np.array(labels), feats, lines)
-            print(f"Chosen cluster for transactions: {chosen} (score: {score:.2f})")
-            
-            # Show analysis of all clusters
-            for lab in set(labels):
-                cluster_lines = [L for L, l in zip(lines, labels) if l == lab]
-                cluster_feats = [f for f, l in zip(feats, labels) if l == lab]
-                money_rate = np.mean([f["has_money"] for f in cluster_feats]) if cluster_feats else 0
-                print(f"  Cluster {lab}: {len(cluster_lines)} lines, money_rate: {money_rate:.2f}")
-                # Show sample lines from each cluster
-                for i, line in enumerate(cluster_lines[:3]):
-                    print(f"    Sample {i+1}: {line.text[:60]}...")
-            
-            txn_lines = [L for L, lab in zip(lines, labels) if lab == chosen]
-            print(f"Found {len(txn_lines)} transaction-like lines in chosen cluster")
-
-            if not txn_lines:
-                print("No transaction lines found in chosen cluster, skipping...")
-                continue
-
-            # Learn a general regex template
-            pat = derive_regex_template(txn_lines)
-            print(f"Generated regex pattern: {pat}")
-            R = re.compile(pat)
-
-            # Parse matched rows into columns
-            matched_count = 0
-            for i, L in enumerate(txn_lines):
-                m = R.match(L.text)
-                if not m:
-                    if i < 3:  # Show first few failed matches for debugging
-                        print(f"  No match for line: {L.text[:100]}...")
-                    continue
-                matched_count += 1
-                if len(m.groups()) == 3:
-                    desc, amt, bal = m.group(1), m.group(2), m.group(3)
-                else:
-                    desc, amt, bal = m.group(1), m.group(2), None
-                # Try to extract date (don’t require it in the regex groups to keep flexible)
-                dm = RE_DATE.search(L.text)
-                date = dm.group(0) if dm else None
-                rows.append(dict(page=pno, raw=L.text, date=date, description=desc, amount=amt, balance=bal))
-            print(f"Matched {matched_count} out of {len(txn_lines)} transaction lines on page {pno}")
-            
-            # Draw page analysis if requested
-            if draw_analysis:
-                draw_page_analysis(page, lines, labels, chosen, pno)
+CSV_FIELDS = ["page", "raw", "date", "description", "amount", "balance"]
 
-    if not rows:
-        print("No transaction-like rows were discovered. Try adjusting OCR/quality or thresholds.")
-        return
+def is_transaction_row(row: Dict[str, Any]) -> bool:
+    """Post-process filter: drop obvious summary/balance rows and rows with no date or description."""
+    # Skip obvious summary/balance lines
+    is_summary = bool(RE_SUMMARY_ROW.search(row['raw'])
+                      or (row['description'] and RE_SUMMARY_ROW.search(row['description'])))
+    
+    # Keep lines that have dates and look like actual transactions
+    has_date = bool(row['date'])
+    has_reasonable_desc = len(row['description'].strip()) > 3 if row['description'] else False
+    
+    return not is_summary and (has_date or has_reasonable_desc)
 
-    # Post-process to filter out obvious non-transaction entries
-    filtered_rows = []
-    summary_keywords = [
-        'previous balance', 'new balance', 'minimum payment', 'payment due',
-        'credit limit', 'past due', 'fees charged', 'cash advance', 
-        'balance transfer', 'messages for details', 'over the credit limit'
-    ]
-    
-    for row in rows:
-        desc_lower = row['description'].lower() if row['description'] else ''
-        raw_lower = row['raw'].lower()
-        
-        # Skip obvious summary/balance lines
-        is_summary = any(keyword in desc_lower or keyword in raw_lower for keyword in summary_keywords)
-        
-        # Keep lines that have dates and look like actual transactions
-        has_date = bool(row['date'])
-        has_reasonable_desc = len(row['description'].strip()) > 3 if row['description'] else False
+def process_page(page, pno: int, draw_analysis: bool = False) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Find and parse the transaction rows on one page (with debug output).
+    Returns the rows and the regex template learned for the page, if any.
+    """
+    rows: List[Dict[str, Any]] = []
+    print(f"\n--- Page {pno} ---")
+    W = float(page.width)
+    lines = load_page_lines(page)
+    print(f"Extracted {len(lines)} lines from page {pno}")
+    
+    if not lines:
+        print("No lines found on this page, skipping...")
+        return rows, None
         
-        if not is_summary and (has_date or has_reasonable_desc):
-            filtered_rows.append(row)
+    # Show first few lines for debugging
+    print("Sample lines:")
+    for i, line in enumerate(lines[:5]):
+        print(f"  {i+1}: {line.text[:80]}...")
+    
+    labels, feats = cluster_transactions(lines, W)
+    print(f"Clustering produced {len(set(labels))} clusters with labels: {set(labels)}")
+    
+    # pick chosen cluster
+    score, chosen = evaluate_clusters(np.array(labels), feats, lines)
+    print(f"Chosen cluster for transactions: {chosen} (score: {score:.2f})")
+    
+    # Show analysis of all clusters
+    for lab in set(labels):
+        cluster_lines = [L for L, l in zip(lines, labels) if l == lab]
+        cluster_feats = [f for f, l in zip(feats, labels) if l == lab]
+        money_rate = np.mean([f["has_money"] for f in cluster_feats]) if cluster_feats else 0
+        print(f"  Cluster {lab}: {len(cluster_lines)} lines, money_rate: {money_rate:.2f}")
+        # Show sample lines from each cluster
+        for i, line in enumerate(cluster_lines[:3]):
+            print(f"    Sample {i+1}: {line.text[:60]}...")
+    
+    txn_lines = [L for L, lab in zip(lines, labels) if lab == chosen]
+    print(f"Found {len(txn_lines)} transaction-like lines in chosen cluster")
+
+    if not txn_lines:
+        print("No transaction lines found in chosen cluster, skipping...")
+        return rows, None
+
+    # Learn a general regex template
+    R = derive_regex_template(txn_lines)
+    print(f"Generated regex pattern: {R.pattern}")
+
+    # Parse matched rows into columns
+    matched_count = 0
+    for i, (L, m) in enumerate(zip(txn_lines, match_lines(R, txn_lines))):
+        if not m:
+            if i < 3:  # Show first few failed matches for debugging
+                print(f"  No match for line: {L.text[:100]}...")
+            continue
+        matched_count += 1
+        groups = m.groups()
+        if len(groups) == 3:
+            desc, amt, bal = groups
         else:
+            (desc, amt), bal = groups, None
+        # Try to extract date (don’t require it in the regex groups to keep flexible)
+        dm = RE_DATE.search(L.text) if L.has_date else None
+        date = dm.group(0) if dm else None
+        row = dict(page=pno, raw=L.text, date=date, description=desc, amount=amt, balance=bal)
+        if not is_transaction_row(row):
             print(f"Filtered out: {row['raw'][:60]}...")
+        rows.append(row)
+    print(f"Matched {matched_count} out of {len(txn_lines)} transaction lines on page {pno}")
     
-    # Save CSV + show learned template
-    df = pd.DataFrame(filtered_rows)
+    # Draw page analysis if requested
+    if draw_analysis:
+        draw_page_analysis(page, lines, labels, chosen, pno)
+    return rows, R.pattern
+
+def _process_page_job(job: Tuple[str, int, bool]) -> Tuple[str, Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Worker entry point: process one page of a PDF, capturing its debug output."""
+    pdf_path, pno, draw_analysis = job
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log), pdfplumber.open(pdf_path) as pdf:
+        result = process_page(pdf.pages[pno - 1], pno, draw_analysis)
+    return log.getvalue(), result
+
+def _process_pages_in_parallel(pdf_path: str, n_pages: int, draw_analysis: bool):
+    """
+    Process pages in a process pool (each worker re-opens the PDF), printing
+    each page's output in page order. Returns process_page's result per page.
+    If the pool cannot start or breaks, the pages it has not finished are
+    processed here instead; errors from a page itself propagate.
+    """
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    jobs = [(pdf_path, pno, draw_analysis) for pno in range(1, n_pages + 1)]
+    page_results = []
+    try:
+        with ProcessPoolExecutor(max_workers=min(n_pages, os.cpu_count() or 1)) as executor:
+            for log, result in executor.map(_process_page_job, jobs):
+                print(log, end="")
+                page_results.append(result)
+    except (BrokenProcessPool, OSError, pickle.PicklingError) as exc:
+        print(f"Parallel page processing failed, falling back to sequential: {exc}")
+        with pdfplumber.open(pdf_path) as pdf:
+            for pno in range(len(page_results) + 1, n_pages + 1):
+                page_results.append(process_page(pdf.pages[pno - 1], pno, draw_analysis))
+    return page_results
+
+def main(pdf_path: str, draw_analysis: bool = False, use_multiprocessing: bool = True):
+    with pdfplumber.open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+    print(f"Processing PDF with {n_pages} pages...")
+
+    if use_multiprocessing and n_pages > 1:
+        page_results = _process_pages_in_parallel(pdf_path, n_pages, draw_analysis)
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_results = [process_page(page, pno, draw_analysis) for pno, page in enumerate(pdf.pages, 1)]
+
+    # Write the rows that pass the post-process filter. The CSV is always
+    # rewritten (header-only when nothing is kept) so it never holds an
+    # earlier statement's rows.
     out_csv = "transactions_extracted.csv"
-    df.to_csv(out_csv, index=False)
-    print(f"Extracted {len(filtered_rows)} transactions (filtered from {len(rows)} total) → {out_csv}")
+    n_rows = n_kept = 0
+    with open(out_csv, "w", newline="") as out:
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        for rows, _pattern in page_results:
+            for row in rows:
+                n_rows += 1
+                if is_transaction_row(row):
+                    writer.writerow(row)
+                    n_kept += 1
+
+    if not n_rows:
+        print("No transaction-like rows were discovered. Try adjusting OCR/quality or thresholds.")
+        print(f"Wrote a header-only {out_csv}")
+        return
+
+    if n_kept:
+        print(f"Extracted {n_kept} transactions (filtered from {n_rows} total) → {out_csv}")
+    else:
+        print(f"All {n_rows} rows were filtered out as non-transactions; wrote a header-only {out_csv}")
 
-    # Also print one learned template (they’re similar per doc)
-    example_template = derive_regex_template([
-        Line(tokens=[], y=0, text=r["raw"]) for r in rows[: min(50, len(rows))]
-    ])
+    # Also print one learned template (they’re similar per doc): the one
+    # most pages learned
+    patterns = Counter(pattern for _rows, pattern in page_results if pattern)
+    example_template = patterns.most_common(1)[0][0]
     print("\nLearned structural regex (no literals):")
     print(example_template)
 
@@ -569,6 +725,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Extract transactions from PDF statements')
     parser.add_argument('pdf_path', help='Path to the PDF statement')
     parser.add_argument('--draw', action='store_true', help='Export PNG analysis for each page')
+    parser.add_argument('--sequential', action='store_true', help='Process pages one at a time in this process')
     
     args = parser.parse_args()
     
@@ -576,4 +733,4 @@ if __name__ == "__main__":
         print("Error: --draw flag requires PIL. Install with: pip install Pillow")
         sys.exit(1)
     
-    main(args.pdf_path, args.draw)
+    main(args.pdf_path, args.draw, use_multiprocessing=not args.sequential)
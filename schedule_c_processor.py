@@ -6,30 +6,78 @@ This script examines the Schedule C PDF form, extracts its structure,
 and populates it with data from the bank statement analyzer.
 """
 
-import pdfplumber
-import pandas as pd
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from PyPDF2 import PdfReader, PdfWriter
+import re
+import sys
 import fitz  # PyMuPDF for form field manipulation
-from bank_statement_analyzer import BankStatementAnalyzer
+
+
+def _write_log(log_lines):
+    """Write collected log lines to stdout in one call."""
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
 
 
 class ScheduleCProcessor:
     """Process Schedule C PDF forms with transaction data."""
     
+    # Lines worth echoing when showing the form's text structure
+    _STRUCTURE_RE = re.compile(r'part ii|expenses|line|advertising|office|travel|meals', re.IGNORECASE)
+    # Schedule C expense line items
+    _EXPENSE_KEYWORDS_RE = re.compile(
+        r'advertising|car and truck|commissions|contract labor|depletion|depreciation|'
+        r'insurance|interest|legal and professional|office expenses|pension|rent|repairs|'
+        r'supplies|taxes and licenses|travel|meals|utilities|wages|other expenses',
+        re.IGNORECASE
+    )
+    
+    # Common Schedule C line mappings (these may need adjustment based on the actual PDF):
+    # each line item maps to name fragments that identify its form field
+    _FIELD_MAPPINGS = {
+        # Part II - Expenses
+        'Advertising': ['advertising', 'line8', 'part2_line8'],
+        'Car and truck expenses': ['car_truck', 'line9', 'part2_line9'],
+        'Commissions and fees': ['commissions', 'line10', 'part2_line10'],
+        'Contract labor': ['contract_labor', 'line11', 'part2_line11'],
+        'Depletion': ['depletion', 'line12', 'part2_line12'],
+        'Depreciation': ['depreciation', 'line13', 'part2_line13'],
+        'Insurance': ['insurance', 'line15', 'part2_line15'],
+        'Interest (mortgage)': ['interest_mortgage', 'line16a', 'part2_line16a'],
+        'Interest (other)': ['interest_other', 'line16b', 'part2_line16b'],
+        'Legal and professional services': ['legal_professional', 'line17', 'part2_line17'],
+        'Office expenses': ['office_expenses', 'line18', 'part2_line18'],
+        'Pension and profit-sharing plans': ['pension', 'line19', 'part2_line19'],
+        'Rent (vehicles, machinery, equipment)': ['rent_equipment', 'line20a', 'part2_line20a'],
+        'Rent (other)': ['rent_other', 'line20b', 'part2_line20b'],
+        'Repairs and maintenance': ['repairs', 'line21', 'part2_line21'],
+        'Supplies': ['supplies', 'line22', 'part2_line22'],
+        'Taxes and licenses': ['taxes_licenses', 'line23', 'part2_line23'],
+        'Travel': ['travel', 'line24a', 'part2_line24a'],
+        'Meals': ['meals', 'line24b', 'part2_line24b'],
+        'Utilities': ['utilities', 'line25', 'part2_line25'],
+        'Wages': ['wages', 'line26', 'part2_line26'],
+        'Other expenses': ['other_expenses', 'line27a', 'part2_line27a'],
+        'Total expenses': ['total_expenses', 'line28', 'part2_line28']
+    }
+    
     def __init__(self, pdf_path="config/schedule_c.pdf"):
         self.pdf_path = pdf_path
         self.form_fields = {}
         self.schedule_c_data = {}
         
-    def analyze_pdf_structure(self):
-        """Analyze the Schedule C PDF to understand its structure and fields."""
+    def analyze_pdf_structure(self, verbose=False):
+        """Analyze the Schedule C PDF to understand its structure and fields.
+        
+        Only the form fields are collected unless verbose is set, in which
+        case the fields, text structure and expense lines are also logged.
+        """
         print(f"Analyzing PDF structure: {self.pdf_path}")
+        log_lines = []
         
         try:
             # Method 1: Try with PyMuPDF for form fields
             doc = fitz.open(self.pdf_path)
+            if verbose:
+                log_lines.append(f"Number of pages: {len(doc)}")
             
             for page_num in range(len(doc)):
                 page = doc[page_num]
@@ -37,68 +85,57 @@ class ScheduleCProcessor:
                 # Get form fields
                 widgets = page.widgets()
                 if widgets:
-                    print(f"\n=== Form Fields on Page {page_num + 1} ===")
+                    if verbose:
+                        log_lines.append(f"\n=== Form Fields on Page {page_num + 1} ===")
                     for widget in widgets:
                         field_name = widget.field_name
                         field_type = widget.field_type_string
                         field_value = widget.field_value
-                        print(f"Field: {field_name}, Type: {field_type}, Value: {field_value}")
+                        if verbose:
+                            log_lines.append(f"Field: {field_name}, Type: {field_type}, Value: {field_value}")
                         self.form_fields[field_name] = {
                             'type': field_type,
                             'value': field_value,
                             'page': page_num
                         }
                 
-                # Extract text to understand structure
-                text = page.get_text()
-                if text and page_num == 0:  # Focus on first page
-                    print(f"\n=== Text Structure Page {page_num + 1} ===")
-                    lines = text.split('\n')
+                if not verbose:
+                    continue
+                
+                # Extract the text blocks once (image blocks skipped); they serve
+                # both the structure and the expense-line scans
+                lines = [block[4].replace('\n', ' ').strip()
+                         for block in page.get_text("blocks") if block[6] == 0]
+                if not lines:
+                    continue
+                
+                if page_num == 0:  # Focus on first page
+                    log_lines.append(f"\n=== Text Structure Page {page_num + 1} ===")
                     for i, line in enumerate(lines):
-                        line = line.strip()
-                        if line and any(keyword in line.lower() for keyword in 
-                                      ['part ii', 'expenses', 'line', 'advertising', 'office', 'travel', 'meals']):
-                            print(f"Line {i}: {line}")
+                        if line and self._STRUCTURE_RE.search(line):
+                            log_lines.append(f"Block {i}: {line}")
+                
+                # Look for Schedule C expense line items
+                expense_lines = [(i, line) for i, line in enumerate(lines)
+                                 if self._EXPENSE_KEYWORDS_RE.search(line)]
+                if expense_lines:
+                    log_lines.append(f"\nExpense lines found on page {page_num + 1}:")
+                    for line_num, line_text in expense_lines:
+                        log_lines.append(f"  {line_num}: {line_text}")
             
             doc.close()
             
         except Exception as e:
             print(f"Error with PyMuPDF: {e}")
-            
-        # Method 2: Try with pdfplumber for text extraction
-        try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                print(f"\n=== PDF Structure with pdfplumber ===")
-                print(f"Number of pages: {len(pdf.pages)}")
-                
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text:
-                        lines = text.split('\n')
-                        expense_lines = []
-                        
-                        for i, line in enumerate(lines):
-                            line = line.strip()
-                            # Look for Schedule C expense line items
-                            if any(keyword in line.lower() for keyword in [
-                                'advertising', 'car and truck', 'commissions', 'contract labor',
-                                'depletion', 'depreciation', 'insurance', 'interest',
-                                'legal and professional', 'office expenses', 'pension',
-                                'rent', 'repairs', 'supplies', 'taxes and licenses',
-                                'travel', 'meals', 'utilities', 'wages', 'other expenses'
-                            ]):
-                                expense_lines.append((i, line))
-                        
-                        if expense_lines:
-                            print(f"\nExpense lines found on page {page_num + 1}:")
-                            for line_num, line_text in expense_lines:
-                                print(f"  {line_num}: {line_text}")
-                        
-        except Exception as e:
-            print(f"Error with pdfplumber: {e}")
+        
+        if verbose:
+            _write_log(log_lines)
     
-    def load_transaction_data(self, statement_files=None):
+    def load_transaction_data(self, statement_files=None, verbose=False):
         """Load and process transaction data from bank statements."""
+        # Imported here: the analyzer pulls in pandas and pdfplumber, which only this step needs
+        from bank_statement_analyzer import BankStatementAnalyzer
+        
         analyzer = BankStatementAnalyzer()
         
         if statement_files:
@@ -121,83 +158,66 @@ class ScheduleCProcessor:
         # Generate Schedule C data
         self.schedule_c_data = analyzer.generate_schedule_c_data()
         
-        if self.schedule_c_data:
-            print(f"\n=== Generated Schedule C Data ===")
-            for line_item, amount in self.schedule_c_data.items():
-                print(f"{line_item}: ${amount:,.2f}")
+        if verbose and self.schedule_c_data:
+            log_lines = [f"\n=== Generated Schedule C Data ==="]
+            log_lines.extend(f"{line_item}: ${amount:,.2f}" for line_item, amount in self.schedule_c_data.items())
+            _write_log(log_lines)
         
         return self.schedule_c_data
     
-    def map_data_to_fields(self):
+    def map_data_to_fields(self, verbose=False):
         """Map the calculated Schedule C data to PDF form fields."""
-        # Common Schedule C line mappings (these may need adjustment based on the actual PDF)
-        field_mappings = {
-            # Part II - Expenses
-            'Advertising': ['advertising', 'line8', 'part2_line8'],
-            'Car and truck expenses': ['car_truck', 'line9', 'part2_line9'],
-            'Commissions and fees': ['commissions', 'line10', 'part2_line10'],
-            'Contract labor': ['contract_labor', 'line11', 'part2_line11'],
-            'Depletion': ['depletion', 'line12', 'part2_line12'],
-            'Depreciation': ['depreciation', 'line13', 'part2_line13'],
-            'Insurance': ['insurance', 'line15', 'part2_line15'],
-            'Interest (mortgage)': ['interest_mortgage', 'line16a', 'part2_line16a'],
-            'Interest (other)': ['interest_other', 'line16b', 'part2_line16b'],
-            'Legal and professional services': ['legal_professional', 'line17', 'part2_line17'],
-            'Office expenses': ['office_expenses', 'line18', 'part2_line18'],
-            'Pension and profit-sharing plans': ['pension', 'line19', 'part2_line19'],
-            'Rent (vehicles, machinery, equipment)': ['rent_equipment', 'line20a', 'part2_line20a'],
-            'Rent (other)': ['rent_other', 'line20b', 'part2_line20b'],
-            'Repairs and maintenance': ['repairs', 'line21', 'part2_line21'],
-            'Supplies': ['supplies', 'line22', 'part2_line22'],
-            'Taxes and licenses': ['taxes_licenses', 'line23', 'part2_line23'],
-            'Travel': ['travel', 'line24a', 'part2_line24a'],
-            'Meals': ['meals', 'line24b', 'part2_line24b'],
-            'Utilities': ['utilities', 'line25', 'part2_line25'],
-            'Wages': ['wages', 'line26', 'part2_line26'],
-            'Other expenses': ['other_expenses', 'line27a', 'part2_line27a'],
-            'Total expenses': ['total_expenses', 'line28', 'part2_line28']
-        }
-        
         mapped_data = {}
+        log_lines = []
+        
+        # Lowercase the PDF's field names once, in form order
+        field_index = [(field_name.lower(), field_name) for field_name in self.form_fields]
         
         for schedule_line, amount in self.schedule_c_data.items():
-            if schedule_line in field_mappings:
-                possible_fields = field_mappings[schedule_line]
+            if schedule_line in self._FIELD_MAPPINGS:
+                possible_fields = self._FIELD_MAPPINGS[schedule_line]
                 
                 # Find matching field in the PDF
-                for field_name in self.form_fields.keys():
-                    field_name_lower = field_name.lower()
+                for field_name_lower, field_name in field_index:
                     if any(possible_field in field_name_lower for possible_field in possible_fields):
                         mapped_data[field_name] = str(amount)
-                        print(f"Mapped {schedule_line} (${amount:,.2f}) -> {field_name}")
+                        if verbose:
+                            log_lines.append(f"Mapped {schedule_line} (${amount:,.2f}) -> {field_name}")
                         break
         
+        _write_log(log_lines)
         return mapped_data
     
-    def populate_pdf(self, output_path="schedule_c_filled.pdf"):
+    def populate_pdf(self, output_path="schedule_c_filled.pdf", verbose=False):
         """Populate the Schedule C PDF with the calculated data."""
         try:
             # Open the PDF with PyMuPDF
             doc = fitz.open(self.pdf_path)
             
             # Get the mapped data
-            mapped_data = self.map_data_to_fields()
+            mapped_data = self.map_data_to_fields(verbose)
             
             if not mapped_data:
                 print("No field mappings found. Creating overlay instead.")
-                return self.create_overlay_pdf(output_path)
+                return self.create_overlay_pdf(output_path, doc)
+            
+            # Index the form's widgets by field name once (a name can repeat
+            # across widgets); the pages are kept so their widgets stay bound
+            pages = list(doc)
+            widgets_by_name = {}
+            for page in pages:
+                for widget in page.widgets():
+                    widgets_by_name.setdefault(widget.field_name, []).append(widget)
             
             # Fill form fields
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                widgets = page.widgets()
-                
-                for widget in widgets:
-                    field_name = widget.field_name
-                    if field_name in mapped_data:
-                        widget.field_value = mapped_data[field_name]
-                        widget.update()
-                        print(f"Filled field {field_name} with {mapped_data[field_name]}")
+            log_lines = []
+            for field_name, value in mapped_data.items():
+                for widget in widgets_by_name.get(field_name, ()):
+                    widget.field_value = value
+                    widget.update()
+                    if verbose:
+                        log_lines.append(f"Filled field {field_name} with {value}")
+            _write_log(log_lines)
             
             # Save the filled PDF
             doc.save(output_path)
@@ -210,67 +230,45 @@ class ScheduleCProcessor:
             print(f"Error filling PDF form: {e}")
             return self.create_overlay_pdf(output_path)
     
-    def create_overlay_pdf(self, output_path="schedule_c_filled.pdf"):
-        """Create an overlay PDF with the data if form filling doesn't work."""
+    def create_overlay_pdf(self, output_path="schedule_c_filled.pdf", doc=None):
+        """Create an overlay PDF with the data if form filling doesn't work.
+        
+        The data is written straight onto the form with PyMuPDF; pass the
+        already-open form as doc to avoid parsing it again.
+        """
         print("Creating overlay PDF with calculated data...")
         
         try:
-            # Create a new PDF with the data
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
+            if doc is None:
+                doc = fitz.open(self.pdf_path)
             
-            # Create overlay
-            overlay_path = "schedule_c_overlay.pdf"
-            c = canvas.Canvas(overlay_path, pagesize=letter)
+            # Draw on the first page (positions are from the bottom edge, as on a letter page)
+            page = doc[0] if len(doc) > 0 else doc.new_page(width=612, height=792)
+            height = page.rect.height
             
             # Add title
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(50, 750, "Schedule C - Calculated Business Expenses")
+            page.insert_text((50, height - 750), "Schedule C - Calculated Business Expenses",
+                             fontname="hebo", fontsize=16)
             
             # Add data
-            c.setFont("Helvetica", 12)
             y_position = 700
             
             for line_item, amount in self.schedule_c_data.items():
-                c.drawString(50, y_position, f"{line_item}:")
-                c.drawString(400, y_position, f"${amount:,.2f}")
+                if page is None:  # Rows that don't fit continue on pages added at the end
+                    page = doc.new_page(width=612, height=792)
+                    height = page.rect.height
+                page.insert_text((50, height - y_position), f"{line_item}:", fontname="helv", fontsize=12)
+                page.insert_text((400, height - y_position), f"${amount:,.2f}", fontname="helv", fontsize=12)
                 y_position -= 20
                 
                 if y_position < 100:  # Start new page if needed
-                    c.showPage()
+                    page = None
                     y_position = 750
             
-            c.save()
-            
-            # Try to merge with original PDF
-            try:
-                from PyPDF2 import PdfReader, PdfWriter
-                
-                reader_original = PdfReader(self.pdf_path)
-                reader_overlay = PdfReader(overlay_path)
-                writer = PdfWriter()
-                
-                # Merge first page
-                if len(reader_original.pages) > 0 and len(reader_overlay.pages) > 0:
-                    page = reader_original.pages[0]
-                    page.merge_page(reader_overlay.pages[0])
-                    writer.add_page(page)
-                    
-                    # Add remaining pages from original
-                    for i in range(1, len(reader_original.pages)):
-                        writer.add_page(reader_original.pages[i])
-                
-                # Save merged PDF
-                with open(output_path, 'wb') as output_file:
-                    writer.write(output_file)
-                
-                print(f"Successfully created merged Schedule C: {output_path}")
-                
-            except Exception as merge_error:
-                print(f"Could not merge PDFs: {merge_error}")
-                print(f"Overlay PDF created separately: {overlay_path}")
-                return overlay_path
+            doc.save(output_path)
+            doc.close()
             
+            print(f"Successfully created merged Schedule C: {output_path}")
             return output_path
             
         except Exception as e:
@@ -278,24 +276,24 @@ class ScheduleCProcessor:
             return None
 
 
-def main():
+def main(verbose=False):
     """Main function to process Schedule C PDF."""
     processor = ScheduleCProcessor()
     
     print("=== Schedule C PDF Processor ===\n")
     
     # Step 1: Analyze PDF structure
-    processor.analyze_pdf_structure()
+    processor.analyze_pdf_structure(verbose)
     
     # Step 2: Load transaction data
-    schedule_data = processor.load_transaction_data()
+    schedule_data = processor.load_transaction_data(verbose=verbose)
     
     if not schedule_data:
         print("No transaction data available. Please process bank statements first.")
         return
     
     # Step 3: Populate the PDF
-    output_file = processor.populate_pdf()
+    output_file = processor.populate_pdf(verbose=verbose)
     
     if output_file:
         print(f"\n✅ Schedule C processing complete!")
@@ -306,4 +304,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(verbose="--verbose" in sys.argv[1:])
@@ -6,10 +6,13 @@ Tests all PDFs in the Statements directory against all available parsers
 to evaluate parsing success rates and generate detailed statistics.
 """
 
+import argparse
 import os
 import sys
 import time
-import pdfplumber
+import hashlib
+import heapq
+import fitz  # PyMuPDF
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 from datetime import datetime
@@ -20,37 +23,151 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from bank_parsers import parser_registry
 from bank_parsers.registry import initialize_parsers  # This ensures parsers are registered
+from bank_parsers.navy_federal import NavyFederalParser
+from bank_parsers.capital_one import CapitalOneParser
+from bank_parsers.citibank import CitibankParser
+from bank_parsers.chase import ChaseParser
+from bank_parsers.bank_of_america import BankOfAmericaParser
 from bank_parsers.generic_regex import GenericRegexParser
 
 # Ensure parsers are initialized
 initialize_parsers()
 
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract text from PDF file."""
+def _build_parsers() -> List[Tuple[str, Any, Exception]]:
+    """Instantiate every parser under test once as (name, parser, init_error)."""
+    parsers = []
+    for parser_name, parser_class in [
+        ('Navy Federal', NavyFederalParser),
+        ('Capital One', CapitalOneParser),
+        ('Citibank', CitibankParser),
+        ('Chase', ChaseParser),
+        ('Bank of America', BankOfAmericaParser),
+        ('Generic', GenericRegexParser)
+    ]:
+        try:
+            parsers.append((parser_name, parser_class(), None))
+        except Exception as e:
+            parsers.append((parser_name, None, e))
+    return parsers
+
+
+# All parsers tested against every PDF, built once rather than per file
+PARSERS = _build_parsers()
+
+# Extracted text keyed by the SHA-256 of each PDF, so re-runs skip extraction
+TEXT_CACHE_DIR = ".pdf_text_cache"
+# Part of every cache key: bump it whenever _extract_text or _page_text change
+# what text they produce, so entries from the old extractor are not reused
+TEXT_EXTRACTOR_VERSION = 1
+
+
+def _page_text(page) -> str:
+    """Rebuild a page's text lines from PyMuPDF words (pdfplumber-style layout)."""
+    lines = []
+    current = []
+    top = None
+    for word in sorted(page.get_text("words"), key=lambda w: (w[1], w[0])):
+        if top is None or abs(word[1] - top) > 3:
+            if current:
+                lines.append(current)
+            current = [word]
+            top = word[1]
+        else:
+            current.append(word)
+    if current:
+        lines.append(current)
+    return "\n".join(" ".join(w[4] for w in sorted(line, key=lambda w: w[0])) for line in lines)
+
+
+def extract_text_from_pdf(pdf_path: str, digest: str = None) -> str:
+    """
+    Extract text from PDF file, reusing the copy cached under TEXT_CACHE_DIR
+    when the file's contents have not changed since the last run. Pass the
+    file's SHA-256 hex digest as digest when it is already known.
+    """
+    if digest is None:
+        try:
+            with open(pdf_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError as e:
+            print(f"Error extracting text from {pdf_path}: {e}")
+            return ""
+    
+    cache_path = os.path.join(TEXT_CACHE_DIR, f"{digest}-v{TEXT_EXTRACTOR_VERSION}.txt")
     try:
+        with open(cache_path, "r", encoding="utf-8", newline="") as f:
+            return f.read()
+    except OSError:
+        pass
+    
+    text = _extract_text(pdf_path)
+    if text:
+        # Write-then-rename so concurrent workers never see a partial entry
+        try:
+            os.makedirs(TEXT_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not cache text for {pdf_path}: {e}")
+    return text
+
+
+def _extract_text(pdf_path: str) -> str:
+    """Extract text from PDF file (PyMuPDF, falling back to pdfplumber)."""
+    try:
+        with fitz.open(pdf_path) as doc:
+            parts = []
+            for page in doc:
+                page_text = _page_text(page)
+                if page_text:
+                    parts.append(page_text)
+                    parts.append("\n")
+            return "".join(parts)
+    except fitz.FileDataError:
+        pass
+    except Exception as e:
+        print(f"Error extracting text from {pdf_path}: {e}")
+        return ""
+    
+    try:
+        import pdfplumber
         with pdfplumber.open(pdf_path) as pdf:
-            text = ""
+            parts = []
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-            return text
+                    parts.append(page_text)
+                    parts.append("\n")
+            return "".join(parts)
     except Exception as e:
         print(f"Error extracting text from {pdf_path}: {e}")
         return ""
 
 
-def test_pdf_with_all_parsers(pdf_path: str) -> Dict[str, Any]:
-    """Test a single PDF with all available parsers."""
-    print(f"\nTesting: {os.path.basename(pdf_path)}")
+def test_pdf_with_all_parsers(pdf_path: str, verbose: bool = True,
+                              diagnostic: bool = False, digest: str = None) -> Dict[str, Any]:
+    """
+    Test a single PDF with the detected parser. In diagnostic mode (the
+    efficacy report) each parser is also tried individually until a
+    bank-specific one succeeds.
+    """
+    return _run_parsers(pdf_path, extract_text_from_pdf(pdf_path, digest), verbose, diagnostic)
+
+
+def _run_parsers(pdf_path: str, text: str, verbose: bool = True,
+                 diagnostic: bool = False) -> Dict[str, Any]:
+    """test_pdf_with_all_parsers on text that has already been extracted."""
+    file_name = os.path.basename(pdf_path)
+    if verbose:
+        print(f"\nTesting: {file_name}")
     
-    # Extract text from PDF
-    text = extract_text_from_pdf(pdf_path)
     if not text:
         return {
             'pdf_path': pdf_path,
-            'file_name': os.path.basename(pdf_path),
+            'file_name': file_name,
             'status': 'failed',
             'error': 'Could not extract text from PDF',
             'detected_parser': None,
@@ -65,7 +182,8 @@ def test_pdf_with_all_parsers(pdf_path: str) -> Dict[str, Any]:
     detected_parser = parser_registry.get_parser(text)
     detected_parser_name = detected_parser.bank_name if detected_parser else "None"
     
-    print(f"  Detected parser: {detected_parser_name}")
+    if verbose:
+        print(f"  Detected parser: {detected_parser_name}")
     
     # Test detected parser
     detected_success = False
@@ -77,33 +195,48 @@ def test_pdf_with_all_parsers(pdf_path: str) -> Dict[str, Any]:
             transactions = detected_parser.extract_transactions(text)
             detected_transactions = len(transactions)
             detected_success = detected_transactions > 0
-            print(f"  Detected parser result: {detected_transactions} transactions")
+            if verbose:
+                print(f"  Detected parser result: {detected_transactions} transactions")
         except Exception as e:
             detected_error = str(e)
-            print(f"  Detected parser error: {detected_error}")
+            if verbose:
+                print(f"  Detected parser error: {detected_error}")
     
     # Test all parsers individually for comprehensive analysis
     all_parser_results = {}
     
-    # Get all registered parsers
-    all_parsers = [
-        ('Navy Federal', 'bank_parsers.navy_federal', 'NavyFederalParser'),
-        ('Capital One', 'bank_parsers.capital_one', 'CapitalOneParser'),
-        ('Citibank', 'bank_parsers.citibank', 'CitibankParser'),
-        ('Chase', 'bank_parsers.chase', 'ChaseParser'),
-        ('Bank of America', 'bank_parsers.bank_of_america', 'BankOfAmericaParser'),
-        ('Generic', 'bank_parsers.generic_regex', 'GenericRegexParser')
-    ]
-    
-    for parser_name, module_name, class_name in all_parsers:
+    # get_parser tries the registered parsers in order, so every parser ahead of
+    # the detected one (all of them when nothing matched) returned can_parse=False
+    rejected_banks = set()
+    if diagnostic:
+        for registered in parser_registry.parsers():
+            if registered is detected_parser:
+                break
+            rejected_banks.add(registered.bank_name)
+    
+    for parser_name, parser, init_error in (PARSERS if diagnostic else []):
+        # Once a bank-specific parser has succeeded the rest (incl. Generic) add nothing
+        if any(r['success'] for r in all_parser_results.values()):
+            break
+        
+        # The detected parser already ran above; reuse its result
+        if detected_parser and parser is not None and parser.bank_name == detected_parser.bank_name:
+            all_parser_results[parser_name] = {
+                'can_parse': True,
+                'success': detected_success,
+                'transactions': detected_transactions,
+                'error': detected_error
+            }
+            if verbose:
+                print(f"  {parser_name}: {'✓' if detected_success else '✗'} ({detected_transactions} transactions)")
+            continue
+        
         try:
-            # Import and instantiate parser
-            module = __import__(module_name, fromlist=[class_name])
-            parser_class = getattr(module, class_name)
-            parser = parser_class()
+            if init_error is not None:
+                raise init_error
             
             # Test if parser can handle this PDF
-            can_parse = parser.can_parse(text)
+            can_parse = parser.bank_name not in rejected_banks and parser.can_parse(text)
             
             if can_parse:
                 try:
@@ -127,7 +260,8 @@ def test_pdf_with_all_parsers(pdf_path: str) -> Dict[str, Any]:
                 'error': error
             }
             
-            print(f"  {parser_name}: {'✓' if success else '✗'} ({transaction_count} transactions)")
+            if verbose:
+                print(f"  {parser_name}: {'✓' if success else '✗'} ({transaction_count} transactions)")
             
         except Exception as e:
             all_parser_results[parser_name] = {
@@ -136,13 +270,14 @@ def test_pdf_with_all_parsers(pdf_path: str) -> Dict[str, Any]:
                 'transactions': 0,
                 'error': f"Parser instantiation error: {str(e)}"
             }
-            print(f"  {parser_name}: ERROR - {str(e)}")
+            if verbose:
+                print(f"  {parser_name}: ERROR - {str(e)}")
     
     parsing_time = time.time() - start_time
     
     return {
         'pdf_path': pdf_path,
-        'file_name': os.path.basename(pdf_path),
+        'file_name': file_name,
         'status': 'success' if detected_success else 'failed',
         'error': detected_error,
         'detected_parser': detected_parser_name,
@@ -152,6 +287,95 @@ def test_pdf_with_all_parsers(pdf_path: str) -> Dict[str, Any]:
     }
 
 
+def _critical_error_result(pdf_path: str, error: Exception) -> Dict[str, Any]:
+    """Result record for a PDF whose test run raised."""
+    return {
+        'pdf_path': pdf_path,
+        'file_name': os.path.basename(pdf_path),
+        'status': 'critical_error',
+        'error': str(error),
+        'detected_parser': None,
+        'transactions_found': 0,
+        'parsing_time': 0,
+        'all_parser_results': {}
+    }
+
+
+def _test_pdf_job(pdf_path: str, digest: str = None) -> Dict[str, Any]:
+    """Process-pool worker: test one PDF quietly, never raising."""
+    try:
+        return test_pdf_with_all_parsers(pdf_path, verbose=False, diagnostic=True, digest=digest)
+    except Exception as e:
+        return _critical_error_result(pdf_path, e)
+
+
+def _test_pdfs_in_processes(pdf_files: List[str],
+                            digests: Dict[str, str] = None) -> List[Dict[str, Any]]:
+    """
+    Test pdf_files in a process pool, printing progress as results arrive.
+    Returns the results in input order, or None if the pool could not be
+    used (the caller then tests the PDFs sequentially). digests maps paths
+    to their known SHA-256 digests (see _dedupe_pdfs).
+    """
+    digests = digests or {}
+    from concurrent.futures import ProcessPoolExecutor
+    
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=min(len(pdf_files), os.cpu_count() or 1)) as executor:
+            jobs = executor.map(_test_pdf_job, pdf_files, [digests.get(p) for p in pdf_files])
+            for i, result in enumerate(jobs, 1):
+                print(f"Progress: {i}/{len(pdf_files)} ({i/len(pdf_files)*100:.1f}%) "
+                      f"{result['file_name']}: {result['detected_parser']} "
+                      f"({result['transactions_found']} transactions)")
+                if result['status'] == 'critical_error':
+                    print(f"Critical error testing {result['pdf_path']}: {result['error']}")
+                results.append(result)
+    except Exception as e:
+        print(f"Parallel testing failed, falling back to sequential: {e}")
+        return None
+    return results
+
+
+def _test_pdfs_sequentially(pdf_files: List[str],
+                            digests: Dict[str, str] = None) -> List[Dict[str, Any]]:
+    """
+    Test pdf_files in this process. A background thread extracts the text of
+    the next few PDFs into a bounded queue while the parsers run on the
+    current one. Extraction mostly holds the GIL (_page_text is plain
+    Python), so the thread mainly hides file and cache reads; the process
+    pool in _test_pdfs_in_processes is the path that actually scales.
+    """
+    import queue
+    import threading
+    
+    digests = digests or {}
+    texts = queue.Queue(maxsize=8)
+    
+    def produce():
+        for pdf_path in pdf_files:
+            try:
+                texts.put((pdf_path, extract_text_from_pdf(pdf_path, digests.get(pdf_path)), None))
+            except Exception as e:
+                texts.put((pdf_path, None, e))
+    
+    threading.Thread(target=produce, daemon=True).start()
+    
+    results = []
+    for i in range(1, len(pdf_files) + 1):
+        pdf_path, text, error = texts.get()
+        print(f"\nProgress: {i}/{len(pdf_files)} ({i/len(pdf_files)*100:.1f}%)")
+        try:
+            if error is not None:
+                raise error
+            results.append(_run_parsers(pdf_path, text, diagnostic=True))
+        except Exception as e:
+            print(f"Critical error testing {pdf_path}: {e}")
+            traceback.print_exc()
+            results.append(_critical_error_result(pdf_path, e))
+    return results
+
+
 def find_all_pdfs(statements_dir: str) -> List[str]:
     """Find all PDF files in the Statements directory."""
     pdf_files = []
@@ -161,24 +385,83 @@ def find_all_pdfs(statements_dir: str) -> List[str]:
         print(f"Statements directory not found: {statements_dir}")
         return pdf_files
     
-    # Walk through all subdirectories
-    for root, dirs, files in os.walk(statements_path):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                pdf_files.append(os.path.join(root, file))
+    # Walk through all subdirectories (symlinked directories are not followed, as with os.walk)
+    pending = [str(statements_path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.lower().endswith('.pdf'):
+                        pdf_files.append(entry.path)
+        except OSError:
+            continue
     
     return sorted(pdf_files)
 
 
+def _dedupe_pdfs(pdf_files: List[str]) -> Tuple[List[str], Dict[str, str], Dict[str, str]]:
+    """
+    Split pdf_files into the files with distinct contents and a map from
+    each byte-identical copy to the first file with the same contents. Also
+    returns each distinct file's SHA-256 digest, which keys the text cache.
+    """
+    unique_files = []
+    duplicates = {}
+    digests = {}
+    first_by_digest = {}
+    for pdf_path in pdf_files:
+        try:
+            with open(pdf_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            unique_files.append(pdf_path)  # Let the test run report the read error
+            continue
+        if digest in first_by_digest:
+            duplicates[pdf_path] = first_by_digest[digest]
+        else:
+            first_by_digest[digest] = pdf_path
+            digests[pdf_path] = digest
+            unique_files.append(pdf_path)
+    return unique_files, duplicates, digests
+
+
+def _pct(part: float, whole: float) -> float:
+    """part as a percentage of whole, or 0 when whole is 0."""
+    return part / whole * 100 if whole else 0.0
+
+
+def _avg(total: float, count: int) -> float:
+    """Mean of total over count, or 0 when count is 0."""
+    return total / count if count else 0.0
+
+
 def generate_statistics_report(results: List[Dict[str, Any]]) -> str:
     """Generate comprehensive statistics report."""
     total_files = len(results)
-    successful_files = len([r for r in results if r['status'] == 'success'])
-    failed_files = total_files - successful_files
+    successful_files = 0
+    successful_results = []
+    failed_results = []
+    processing_times = []
     
-    # Parser detection statistics
+    # Parser detection statistics and individual parser performance, gathered in one pass
     parser_detection_stats = {}
+    parser_names = [parser_name for parser_name, _, _ in PARSERS]
+    parser_performance = {
+        parser_name: {'tried_count': 0, 'can_parse_count': 0, 'successful_count': 0,
+                      'total_transactions': 0, 'error_count': 0}
+        for parser_name in parser_names
+    }
+    
     for result in results:
+        if result['status'] == 'success':
+            successful_files += 1
+            successful_results.append(result)
+        elif result['status'] == 'failed':
+            failed_results.append(result)
+        processing_times.append(result['parsing_time'])
+        
         parser = result['detected_parser']
         if parser not in parser_detection_stats:
             parser_detection_stats[parser] = {'count': 0, 'successful': 0, 'total_transactions': 0}
@@ -186,83 +469,79 @@ def generate_statistics_report(results: List[Dict[str, Any]]) -> str:
         if result['status'] == 'success':
             parser_detection_stats[parser]['successful'] += 1
             parser_detection_stats[parser]['total_transactions'] += result['transactions_found']
+        
+        for parser_name, parser_result in result['all_parser_results'].items():
+            stats = parser_performance.get(parser_name)
+            if stats is None:
+                continue
+            # Parsers after one that succeeded are skipped and have no entry
+            stats['tried_count'] += 1
+            if parser_result['can_parse']:
+                stats['can_parse_count'] += 1
+            if parser_result['success']:
+                stats['successful_count'] += 1
+                stats['total_transactions'] += parser_result['transactions']
+            if parser_result['error'] and parser_result['error'] != "Parser cannot handle this PDF format":
+                stats['error_count'] += 1
     
-    # Individual parser performance
-    parser_performance = {}
-    parser_names = ['Navy Federal', 'Capital One', 'Citibank', 'Chase', 'Bank of America', 'Generic']
-    
-    for parser_name in parser_names:
-        parser_performance[parser_name] = {
-            'can_parse_count': 0,
-            'successful_count': 0,
-            'total_transactions': 0,
-            'error_count': 0
-        }
-    
-    for result in results:
-        for parser_name in parser_names:
-            if parser_name in result['all_parser_results']:
-                parser_result = result['all_parser_results'][parser_name]
-                if parser_result['can_parse']:
-                    parser_performance[parser_name]['can_parse_count'] += 1
-                if parser_result['success']:
-                    parser_performance[parser_name]['successful_count'] += 1
-                    parser_performance[parser_name]['total_transactions'] += parser_result['transactions']
-                if parser_result['error'] and parser_result['error'] != "Parser cannot handle this PDF format":
-                    parser_performance[parser_name]['error_count'] += 1
+    failed_files = total_files - successful_files
     
     # Generate report
-    report = []
-    report.append("=" * 80)
-    report.append("COMPREHENSIVE PARSER EFFICACY REPORT")
-    report.append("=" * 80)
-    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
-    
-    # Overall Statistics
-    report.append("OVERALL STATISTICS")
-    report.append("-" * 40)
-    report.append(f"Total PDF files tested: {total_files}")
-    report.append(f"Successfully parsed: {successful_files} ({successful_files/total_files*100:.1f}%)")
-    report.append(f"Failed to parse: {failed_files} ({failed_files/total_files*100:.1f}%)")
-    report.append("")
-    
-    # Parser Detection Results
-    report.append("PARSER DETECTION RESULTS")
-    report.append("-" * 40)
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    report = [
+        "=" * 80,
+        "COMPREHENSIVE PARSER EFFICACY REPORT",
+        "=" * 80,
+        f"Generated: {generated_at}",
+        "",
+        
+        # Overall Statistics
+        "OVERALL STATISTICS",
+        "-" * 40,
+        f"Total PDF files tested: {total_files}",
+        f"Successfully parsed: {successful_files} ({_pct(successful_files, total_files):.1f}%)",
+        f"Failed to parse: {failed_files} ({_pct(failed_files, total_files):.1f}%)",
+        "",
+        
+        # Parser Detection Results
+        "PARSER DETECTION RESULTS",
+        "-" * 40,
+    ]
     for parser, stats in sorted(parser_detection_stats.items()):
-        success_rate = stats['successful'] / stats['count'] * 100 if stats['count'] > 0 else 0
-        avg_transactions = stats['total_transactions'] / stats['successful'] if stats['successful'] > 0 else 0
-        report.append(f"{parser}:")
-        report.append(f"  Files detected: {stats['count']}")
-        report.append(f"  Successfully parsed: {stats['successful']} ({success_rate:.1f}%)")
-        report.append(f"  Average transactions per file: {avg_transactions:.1f}")
-        report.append("")
+        report.extend([
+            f"{parser}:",
+            f"  Files detected: {stats['count']}",
+            f"  Successfully parsed: {stats['successful']} ({_pct(stats['successful'], stats['count']):.1f}%)",
+            f"  Average transactions per file: {_avg(stats['total_transactions'], stats['successful']):.1f}",
+            "",
+        ])
     
     # Individual Parser Performance
-    report.append("INDIVIDUAL PARSER PERFORMANCE")
-    report.append("-" * 40)
+    report.extend(["INDIVIDUAL PARSER PERFORMANCE", "-" * 40])
     for parser_name in parser_names:
         stats = parser_performance[parser_name]
-        can_parse_rate = stats['can_parse_count'] / total_files * 100
-        success_rate = stats['successful_count'] / stats['can_parse_count'] * 100 if stats['can_parse_count'] > 0 else 0
-        avg_transactions = stats['total_transactions'] / stats['successful_count'] if stats['successful_count'] > 0 else 0
-        
-        report.append(f"{parser_name}:")
-        report.append(f"  Can parse: {stats['can_parse_count']}/{total_files} ({can_parse_rate:.1f}%)")
-        report.append(f"  Successful extractions: {stats['successful_count']}/{stats['can_parse_count']} ({success_rate:.1f}%)")
-        report.append(f"  Total transactions extracted: {stats['total_transactions']}")
-        report.append(f"  Average transactions per successful file: {avg_transactions:.1f}")
-        report.append(f"  Errors encountered: {stats['error_count']}")
-        report.append("")
+        report.extend([
+            f"{parser_name}:",
+            f"  Tried on: {stats['tried_count']}/{total_files} files",
+            f"  Can parse: {stats['can_parse_count']}/{stats['tried_count']} "
+            f"({_pct(stats['can_parse_count'], stats['tried_count']):.1f}%)",
+            f"  Successful extractions: {stats['successful_count']}/{stats['can_parse_count']} "
+            f"({_pct(stats['successful_count'], stats['can_parse_count']):.1f}%)",
+            f"  Total transactions extracted: {stats['total_transactions']}",
+            f"  Average transactions per successful file: "
+            f"{_avg(stats['total_transactions'], stats['successful_count']):.1f}",
+            f"  Errors encountered: {stats['error_count']}",
+            "",
+        ])
     
     # Failed Files Analysis
-    failed_results = [r for r in results if r['status'] == 'failed']
     if failed_results:
-        report.append("FAILED FILES ANALYSIS")
-        report.append("-" * 40)
-        report.append(f"Total failed files: {len(failed_results)}")
-        report.append("")
+        report.extend([
+            "FAILED FILES ANALYSIS",
+            "-" * 40,
+            f"Total failed files: {len(failed_results)}",
+            "",
+        ])
         
         # Group by error type
         error_types = {}
@@ -275,73 +554,86 @@ def generate_statistics_report(results: List[Dict[str, Any]]) -> str:
         for error, files in error_types.items():
             report.append(f"Error: {error}")
             report.append(f"  Files affected ({len(files)}):")
-            for file in files[:10]:  # Show first 10 files
-                report.append(f"    - {file}")
+            report.extend(f"    - {file}" for file in files[:10])  # Show first 10 files
             if len(files) > 10:
                 report.append(f"    ... and {len(files) - 10} more")
             report.append("")
     
     # Top Performing Files
-    successful_results = [r for r in results if r['status'] == 'success']
     if successful_results:
-        successful_results.sort(key=lambda x: x['transactions_found'], reverse=True)
-        report.append("TOP PERFORMING FILES")
-        report.append("-" * 40)
-        for i, result in enumerate(successful_results[:10]):
-            report.append(f"{i+1:2d}. {result['file_name']}")
-            report.append(f"    Parser: {result['detected_parser']}")
-            report.append(f"    Transactions: {result['transactions_found']}")
-            report.append(f"    Processing time: {result['parsing_time']:.2f}s")
-            report.append("")
+        top_results = heapq.nlargest(10, successful_results, key=lambda x: x['transactions_found'])
+        report.extend(["TOP PERFORMING FILES", "-" * 40])
+        for i, result in enumerate(top_results):
+            report.extend([
+                f"{i+1:2d}. {result['file_name']}",
+                f"    Parser: {result['detected_parser']}",
+                f"    Transactions: {result['transactions_found']}",
+                f"    Processing time: {result['parsing_time']:.2f}s",
+                "",
+            ])
     
     # Performance Statistics
-    processing_times = [r['parsing_time'] for r in results]
     if processing_times:
-        report.append("PERFORMANCE STATISTICS")
-        report.append("-" * 40)
-        report.append(f"Average processing time: {sum(processing_times)/len(processing_times):.2f}s")
-        report.append(f"Fastest processing time: {min(processing_times):.2f}s")
-        report.append(f"Slowest processing time: {max(processing_times):.2f}s")
-        report.append("")
+        report.extend([
+            "PERFORMANCE STATISTICS",
+            "-" * 40,
+            f"Average processing time: {_avg(sum(processing_times), len(processing_times)):.2f}s",
+            f"Fastest processing time: {min(processing_times):.2f}s",
+            f"Slowest processing time: {max(processing_times):.2f}s",
+            "",
+        ])
     
     # Recommendations
-    report.append("RECOMMENDATIONS")
-    report.append("-" * 40)
+    report.extend(["RECOMMENDATIONS", "-" * 40])
     
-    # Check Generic Parser performance
+    # Check Generic Parser performance, on the files it was actually tried on
     generic_stats = parser_performance.get('Generic', {})
     if generic_stats.get('successful_count', 0) > 0:
         report.append("✓ Generic Parser is working and providing fallback support")
+    elif generic_stats.get('tried_count', 0) > 0:
+        report.append(f"⚠ Generic Parser may need tuning - no successful extractions "
+                      f"on the {generic_stats['tried_count']} files it was tried on")
     else:
-        report.append("⚠ Generic Parser may need tuning - no successful extractions")
+        report.append("ℹ Generic Parser was not tried - a bank-specific parser handled every file")
     
     # Check for high failure rates
     if failed_files / total_files > 0.3:
-        report.append("⚠ High failure rate detected - consider:")
-        report.append("  - Adding more bank-specific parsers")
-        report.append("  - Improving Generic Parser training")
-        report.append("  - Checking PDF quality and format compatibility")
+        report.extend([
+            "⚠ High failure rate detected - consider:",
+            "  - Adding more bank-specific parsers",
+            "  - Improving Generic Parser training",
+            "  - Checking PDF quality and format compatibility",
+        ])
     
     # Check parser coverage
     undetected_count = parser_detection_stats.get('None', {}).get('count', 0)
     if undetected_count > 0:
-        report.append(f"⚠ {undetected_count} files had no parser detection")
-        report.append("  - Consider adding parsers for these statement types")
-        report.append("  - Use regex_builder.py to analyze unsupported formats")
+        report.extend([
+            f"⚠ {undetected_count} files had no parser detection",
+            "  - Consider adding parsers for these statement types",
+            "  - Use regex_builder.py to analyze unsupported formats",
+        ])
     
-    report.append("")
-    report.append("=" * 80)
+    report.extend(["", "=" * 80])
     
     return "\n".join(report)
 
 
-def main():
-    """Main test function."""
+def main(statements_dir: str = None, use_multiprocessing: bool = True):
+    """Main test function.
+    
+    statements_dir defaults to the Statements folder next to this script.
+    """
     print("Comprehensive Parser Efficacy Test")
     print("=" * 50)
     
+    if statements_dir is None:
+        statements_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Statements")
+    if not os.path.isdir(statements_dir):
+        print(f"Statements directory not found: {statements_dir}")
+        return
+    
     # Find all PDF files
-    statements_dir = "/Users/rjones/Documents/Programming files/statement_organizer/Statements"
     pdf_files = find_all_pdfs(statements_dir)
     
     print(f"Found {len(pdf_files)} PDF files to test")
@@ -351,30 +643,33 @@ def main():
         return
     
     # Test each PDF
-    results = []
     start_time = time.time()
     
-    print(f"\nTesting all {len(pdf_files)} PDF files...")
+    # Copies of the same statement (backups, re-downloads) are only parsed once
+    unique_files, duplicates, digests = _dedupe_pdfs(pdf_files)
+    if duplicates:
+        print(f"Skipping {len(duplicates)} duplicate PDF files with identical contents")
+    
+    print(f"\nTesting all {len(unique_files)} PDF files...")
     print("This may take several minutes...")
     
-    for i, pdf_path in enumerate(pdf_files, 1):
-        print(f"\nProgress: {i}/{len(pdf_files)} ({i/len(pdf_files)*100:.1f}%)")
-        try:
-            result = test_pdf_with_all_parsers(pdf_path)
-            results.append(result)
-        except Exception as e:
-            print(f"Critical error testing {pdf_path}: {e}")
-            traceback.print_exc()
-            results.append({
+    results = None
+    if use_multiprocessing and len(unique_files) > 1:
+        results = _test_pdfs_in_processes(unique_files, digests)
+    if results is None:
+        results = _test_pdfs_sequentially(unique_files, digests)
+    
+    # Give every copy its original's result, keeping the files' order
+    if duplicates:
+        results_by_path = dict(zip(unique_files, results))
+        results = [
+            results_by_path[pdf_path] if pdf_path not in duplicates else {
+                **results_by_path[duplicates[pdf_path]],
                 'pdf_path': pdf_path,
                 'file_name': os.path.basename(pdf_path),
-                'status': 'critical_error',
-                'error': str(e),
-                'detected_parser': None,
-                'transactions_found': 0,
-                'parsing_time': 0,
-                'all_parser_results': {}
-            })
+            }
+            for pdf_path in pdf_files
+        ]
     
     total_time = time.time() - start_time
     
@@ -405,4 +700,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser(description="Test every PDF in a statements folder against all parsers.")
+    ap.add_argument("statements_dir", nargs="?", default=None,
+                    help="folder to scan for PDFs (default: Statements next to this script)")
+    ap.add_argument("--sequential", action="store_true",
+                    help="test the PDFs in this process instead of a process pool")
+    args = ap.parse_args()
+    main(args.statements_dir, use_multiprocessing=not args.sequential)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+BankStatementAnalyzer multi-statement tests
+-------------------------------------------
+Checks that extracting several statements in sequence never hands back an
+earlier statement's transactions for a later one.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+# Project root on path.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_statement_analyzer import BankStatementAnalyzer
+
+
+class _FailingPipeline:
+    """Stands in for ReconciliationPipeline so extraction takes the legacy path."""
+
+    def __init__(self, status_callback=None):
+        pass
+
+    def extract(self, pdf_path):
+        raise RuntimeError("pipeline unavailable")
+
+
+class _BrokenPool:
+    """Stands in for ProcessPoolExecutor when the pool dies on first use."""
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        raise BrokenProcessPool("worker died")
+
+
+class _OneTransactionParser:
+    def extract_transactions(self, text):
+        return [{"date": None, "description": "COFFEE SHOP", "amount": -4.5}]
+
+
+class LegacyFallbackTest(unittest.TestCase):
+    """Two statements; only the first one has a matching parser."""
+
+    PDFS = ["known_bank.pdf", "unknown_bank.pdf"]
+
+    def setUp(self):
+        patches = [
+            mock.patch("bank_parsers.reconciliation_pipeline.ReconciliationPipeline", _FailingPipeline),
+            mock.patch("bank_parsers.registry.initialize_parsers", lambda: None),
+            mock.patch("bank_parsers.registry.detect_bank",
+                       lambda text, pdf_path: "Known" if pdf_path == "known_bank.pdf" else None),
+            mock.patch("bank_parsers.registry.get_parser_for_bank",
+                       lambda bank: _OneTransactionParser() if bank == "Known" else None),
+            mock.patch("bank_parsers.transaction_filters.clean_transactions", lambda raw: list(raw)),
+            mock.patch.object(BankStatementAnalyzer, "_extract_text_from_pdf",
+                              staticmethod(lambda pdf_path: "statement text")),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.analyzer = BankStatementAnalyzer()
+        self.analyzer.categorize_transactions = lambda *args, **kwargs: None
+
+    def test_unmatched_statement_yields_nothing(self):
+        txns = list(self.analyzer.iter_categorized_transactions(self.PDFS, use_multiprocessing=False))
+        self.assertEqual(len(txns), 1)
+
+    def test_unmatched_statement_adds_nothing_to_merge(self):
+        txns = self.analyzer.extract_from_multiple_pdfs(self.PDFS, use_multiprocessing=False)
+        self.assertEqual(len(txns), 1)
+
+    def test_streaming_leaves_analyzer_transactions_alone(self):
+        self.analyzer.transactions = ["earlier"]
+        list(self.analyzer.iter_categorized_transactions(self.PDFS, use_multiprocessing=False))
+        self.assertEqual(self.analyzer.transactions, ["earlier"])
+
+    def test_broken_pool_falls_back_to_sequential(self):
+        with mock.patch("concurrent.futures.ProcessPoolExecutor", _BrokenPool):
+            txns = list(self.analyzer.iter_categorized_transactions(self.PDFS))
+        self.assertEqual(len(txns), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()